@@ -3,56 +3,116 @@ NovaIR Simulated System - For testing and demonstration.
 
 This module provides a simulated system that responds to actions
 in a realistic way, perfect for testing NovaIR without real hardware.
+
+Metric state is stored as parallel NumPy arrays (structure-of-arrays)
+so that one tick updates every metric in a handful of vectorized
+operations instead of per-metric Python calls.
 """
 
-import random
 import math
-from typing import Dict, List, Any, Callable
-from dataclasses import dataclass, field
-from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional
+
+import numpy as np
+
+# Try to import numba for a JIT-compiled tick kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # Eagerly compiled for float32: telemetry-grade data doesn't need
+    # float64, and the narrower lanes double SIMD throughput.
+    @njit('void(f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], f4[:])',
+          cache=True, fastmath=True)
+    def _tick_kernel(val, tgt, mn, mx, noise, drift, inertia, rand):
+        """Fused per-metric update: inertia, drift, noise, clamp."""
+        one = np.float32(1.0)
+        hundredth = np.float32(0.01)
+        for i in range(val.shape[0]):
+            v = val[i] + (tgt[i] - val[i]) * (one - inertia[i]) + drift[i]
+            v += v * (noise[i] * hundredth) * rand[i]
+            # Conditional-expression clamp lowers to FP min/max cmovs
+            val[i] = mn[i] if v < mn[i] else (mx[i] if v > mx[i] else v)
 
 
-@dataclass
 class SimulatedMetric:
-    """A simulated metric with realistic behavior."""
-    name: str
-    value: float
-    min_value: float = 0.0
-    max_value: float = 100.0
-    noise: float = 0.5  # Random noise percentage
-    drift: float = 0.0  # Natural drift per tick
-    inertia: float = 0.8  # How slowly it responds to changes (0-1)
+    """A view onto one metric of a SimulatedSystem.
+
+    The actual values live in the system's parallel arrays; this class
+    exposes them with the familiar per-metric attribute API.
+    """
+
+    __slots__ = ("_system", "_index", "name")
+
+    def __init__(self, system: "SimulatedSystem", index: int, name: str):
+        self._system = system
+        self._index = index
+        self.name = name
+
+    @property
+    def value(self) -> float:
+        return float(self._system._val[self._index])
 
-    _target: float = field(default=None, init=False)
+    @value.setter
+    def value(self, v: float) -> None:
+        self._system._val[self._index] = v
 
-    def __post_init__(self):
-        self._target = self.value
+    @property
+    def min_value(self) -> float:
+        return float(self._system._min[self._index])
+
+    @property
+    def max_value(self) -> float:
+        return float(self._system._max[self._index])
+
+    @property
+    def noise(self) -> float:
+        return float(self._system._noise[self._index])
+
+    @property
+    def drift(self) -> float:
+        return float(self._system._drift[self._index])
+
+    @drift.setter
+    def drift(self, v: float) -> None:
+        self._system._drift[self._index] = v
+
+    @property
+    def inertia(self) -> float:
+        return float(self._system._inertia[self._index])
 
     def set_target(self, target: float) -> None:
         """Set target value (actual value will approach this over time)."""
-        self._target = max(self.min_value, min(self.max_value, target))
+        self._system._tgt[self._index] = max(
+            self.min_value, min(self.max_value, target))
 
     def apply_effect(self, delta: float) -> None:
         """Apply an effect (change target by delta)."""
-        self.set_target(self._target + delta)
+        self.set_target(float(self._system._tgt[self._index]) + delta)
 
-    def tick(self) -> float:
-        """Update value for one tick."""
-        # Apply inertia (gradual approach to target)
-        diff = self._target - self.value
-        self.value += diff * (1 - self.inertia)
+    def __repr__(self) -> str:
+        return f"SimulatedMetric({self.name}={self.value:.1f})"
 
-        # Apply drift
-        self.value += self.drift
 
-        # Apply noise
-        noise_amount = self.value * (self.noise / 100) * random.uniform(-1, 1)
-        self.value += noise_amount
+# Parameter extractors shared by the precompiled action tables. Each maps
+# the raw parameter dict to the scalar that multiplies the coefficients.
+def _p_level(params: Dict[str, int]) -> float:
+    return params.get("amount", params.get("level", 1))
 
-        # Clamp to bounds
-        self.value = max(self.min_value, min(self.max_value, self.value))
 
-        return self.value
+def _p_lanes(params: Dict[str, int]) -> float:
+    return params.get("lanes", 1)
+
+
+def _p_percent(params: Dict[str, int]) -> float:
+    return params.get("percent", 10)
+
+
+def _p_one(params: Dict[str, int]) -> float:
+    return 1.0
 
 
 class SimulatedSystem:
@@ -62,9 +122,17 @@ class SimulatedSystem:
     physics: temperature rises under load, fan cools it down, etc.
     """
 
-    def __init__(self, scenario: str = "thermostat"):
+    def __init__(self, scenario: str = "thermostat", seed: Optional[int] = None):
         self.scenario = scenario
+        # PCG64 generator instance: one vectorized uniform() call per tick
+        # instead of per-metric draws from the global Mersenne Twister.
+        self._rng = np.random.default_rng(seed)
         self.metrics: Dict[str, SimulatedMetric] = {}
+        self._actions: Dict[str, Callable[[Dict[str, int]], bool]] = {}
+        # Linear actions compiled to (indices, coefficients, param getter);
+        # applied as one indexed NumPy update in apply_action.
+        self._action_tbl: Dict[str, tuple] = {}
+        self._physics_fn: Callable[[], None] = lambda: None
         self.tick_count = 0
         self._load_scenario(scenario)
 
@@ -79,272 +147,238 @@ class SimulatedSystem:
         else:
             self._setup_thermostat()  # Default
 
+    def _install_metrics(self, specs: List[Dict[str, float]]) -> None:
+        """Pack metric specs into parallel arrays and build metric views.
+
+        Each spec is a dict with keys: name, value, min_value, max_value,
+        noise (random noise percentage), drift (natural drift per tick),
+        and inertia (how slowly it responds to changes, 0-1).
+        """
+        self._names = [s["name"] for s in specs]
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        # Stable metric ordering, frozen at setup; pairs with read_array().
+        self.metric_names = tuple(self._names)
+
+        # float32 halves memory bandwidth and is plenty for simulated
+        # telemetry with 0.1-5% noise.
+        self._val = np.array([s["value"] for s in specs], dtype=np.float32)
+        self._tgt = self._val.copy()
+        self._min = np.array([s.get("min_value", 0.0) for s in specs], dtype=np.float32)
+        self._max = np.array([s.get("max_value", 100.0) for s in specs], dtype=np.float32)
+        self._noise = np.array([s.get("noise", 0.5) for s in specs], dtype=np.float32)
+        self._drift = np.array([s.get("drift", 0.0) for s in specs], dtype=np.float32)
+        self._inertia = np.array([s.get("inertia", 0.8) for s in specs], dtype=np.float32)
+
+        # Scratch buffers reused every tick so steady-state ticking
+        # performs no allocations.
+        n = len(self._names)
+        self._diff = np.empty(n, dtype=np.float32)
+        self._noise_buf = np.empty(n, dtype=np.float32)
+        self._rand_buf = np.empty(n, dtype=np.float32)
+
+        self.metrics = {name: SimulatedMetric(self, i, name)
+                        for i, name in enumerate(self._names)}
+
     def _setup_thermostat(self) -> None:
         """Setup thermostat scenario."""
-        self.metrics = {
-            "temperature": SimulatedMetric(
-                name="temperature",
-                value=65.0,
-                min_value=20.0,
-                max_value=100.0,
-                noise=0.3,
-                drift=0.1,  # Naturally heats up
-                inertia=0.9
-            ),
-            "fan_speed": SimulatedMetric(
-                name="fan_speed",
-                value=30.0,
-                min_value=0.0,
-                max_value=100.0,
-                noise=0.1,
-                inertia=0.7
-            ),
-            "target": SimulatedMetric(
-                name="target",
-                value=65.0,
-                min_value=20.0,
-                max_value=80.0,
-                noise=0.0,
-                inertia=1.0  # Instant
-            ),
+        self._install_metrics([
+            dict(name="temperature", value=65.0, min_value=20.0, max_value=100.0,
+                 noise=0.3, drift=0.1, inertia=0.9),  # Naturally heats up
+            dict(name="fan_speed", value=30.0, min_value=0.0, max_value=100.0,
+                 noise=0.1, inertia=0.7),
+            dict(name="target", value=65.0, min_value=20.0, max_value=80.0,
+                 noise=0.0, inertia=1.0),  # Instant
+        ])
+        self._action_tbl = {
+            "increase_fan": self._compile_action(
+                {"fan_speed": 10.0, "temperature": -3.0}, _p_level),
+            "decrease_fan": self._compile_action(
+                {"fan_speed": -10.0, "temperature": 2.0}, _p_level),
+        }
+        self._actions = {
+            "emergency_cooling": self._act_emergency_cooling,
         }
+        self._i_temp = self._idx["temperature"]
+        self._i_fan = self._idx["fan_speed"]
+        self._physics_fn = self._physics_thermostat
 
     def _setup_load_balancer(self) -> None:
         """Setup load balancer scenario."""
-        self.metrics = {
-            "cpu_usage": SimulatedMetric(
-                name="cpu_usage",
-                value=50.0,
-                min_value=0.0,
-                max_value=100.0,
-                noise=2.0,
-                drift=0.5,  # Load naturally increases
-                inertia=0.85
-            ),
-            "memory_usage": SimulatedMetric(
-                name="memory_usage",
-                value=40.0,
-                min_value=0.0,
-                max_value=100.0,
-                noise=1.0,
-                drift=0.2,
-                inertia=0.9
-            ),
-            "queue_depth": SimulatedMetric(
-                name="queue_depth",
-                value=500.0,
-                min_value=0.0,
-                max_value=20000.0,
-                noise=5.0,
-                drift=50.0,  # Requests keep coming
-                inertia=0.7
-            ),
-            "latency_p95": SimulatedMetric(
-                name="latency_p95",
-                value=30.0,
-                min_value=1.0,
-                max_value=500.0,
-                noise=3.0,
-                inertia=0.8
-            ),
-            "active_lanes": SimulatedMetric(
-                name="active_lanes",
-                value=4.0,
-                min_value=1.0,
-                max_value=8.0,
-                noise=0.0,
-                inertia=1.0
-            ),
+        self._install_metrics([
+            dict(name="cpu_usage", value=50.0, min_value=0.0, max_value=100.0,
+                 noise=2.0, drift=0.5, inertia=0.85),  # Load naturally increases
+            dict(name="memory_usage", value=40.0, min_value=0.0, max_value=100.0,
+                 noise=1.0, drift=0.2, inertia=0.9),
+            dict(name="queue_depth", value=500.0, min_value=0.0, max_value=20000.0,
+                 noise=5.0, drift=50.0, inertia=0.7),  # Requests keep coming
+            dict(name="latency_p95", value=30.0, min_value=1.0, max_value=500.0,
+                 noise=3.0, inertia=0.8),
+            dict(name="active_lanes", value=4.0, min_value=1.0, max_value=8.0,
+                 noise=0.0, inertia=1.0),
+        ])
+        self._action_tbl = {
+            "scale_up": self._compile_action(
+                {"active_lanes": 1.0, "cpu_usage": -10.0,
+                 "queue_depth": -500.0}, _p_lanes),
+            "scale_down": self._compile_action(
+                {"active_lanes": -1.0, "cpu_usage": 8.0}, _p_lanes),
+            "shed_load": self._compile_action(
+                {"queue_depth": -100.0, "cpu_usage": -2.0}, _p_percent),
+            "throttle": self._compile_action(
+                {"cpu_usage": -15.0, "latency_p95": 20.0}, _p_one),
+            "free_cache": self._compile_action(
+                {"memory_usage": -15.0, "latency_p95": 5.0}, _p_one),
         }
+        self._actions = {}
+        self._i_cpu = self._idx["cpu_usage"]
+        self._i_queue = self._idx["queue_depth"]
+        self._i_latency = self._idx["latency_p95"]
+        self._physics_fn = self._physics_load_balancer
 
     def _setup_frame_optimizer(self) -> None:
         """Setup frame optimizer scenario."""
-        self.metrics = {
-            "fps": SimulatedMetric(
-                name="fps",
-                value=55.0,
-                min_value=10.0,
-                max_value=144.0,
-                noise=2.0,
-                inertia=0.85
-            ),
-            "frame_time": SimulatedMetric(
-                name="frame_time",
-                value=18.0,
-                min_value=7.0,
-                max_value=100.0,
-                noise=1.0,
-                inertia=0.85
-            ),
-            "gpu_usage": SimulatedMetric(
-                name="gpu_usage",
-                value=70.0,
-                min_value=0.0,
-                max_value=100.0,
-                noise=1.5,
-                drift=0.3,
-                inertia=0.9
-            ),
-            "vram_usage": SimulatedMetric(
-                name="vram_usage",
-                value=60.0,
-                min_value=0.0,
-                max_value=100.0,
-                noise=0.5,
-                drift=0.1,
-                inertia=0.95
-            ),
-            "render_quality": SimulatedMetric(
-                name="render_quality",
-                value=3.0,
-                min_value=1.0,
-                max_value=5.0,
-                noise=0.0,
-                inertia=1.0
-            ),
+        self._install_metrics([
+            dict(name="fps", value=55.0, min_value=10.0, max_value=144.0,
+                 noise=2.0, inertia=0.85),
+            dict(name="frame_time", value=18.0, min_value=7.0, max_value=100.0,
+                 noise=1.0, inertia=0.85),
+            dict(name="gpu_usage", value=70.0, min_value=0.0, max_value=100.0,
+                 noise=1.5, drift=0.3, inertia=0.9),
+            dict(name="vram_usage", value=60.0, min_value=0.0, max_value=100.0,
+                 noise=0.5, drift=0.1, inertia=0.95),
+            dict(name="render_quality", value=3.0, min_value=1.0, max_value=5.0,
+                 noise=0.0, inertia=1.0),
+        ])
+        self._action_tbl = {
+            "increase_quality": self._compile_action(
+                {"render_quality": 1.0, "gpu_usage": 15.0, "fps": -10.0},
+                _p_one),
+            "decrease_quality": self._compile_action(
+                {"render_quality": -1.0, "gpu_usage": -12.0, "fps": 8.0},
+                _p_one),
+            "flush_vram": self._compile_action(
+                {"vram_usage": -20.0, "frame_time": 5.0}, _p_one),
         }
+        self._actions = {
+            "dynamic_resolution": self._act_dynamic_resolution,
+        }
+        self._i_fps = self._idx["fps"]
+        self._i_frame_time = self._idx["frame_time"]
+        self._i_gpu = self._idx["gpu_usage"]
+        self._physics_fn = self._physics_frame_optimizer
 
     def read(self, metric: str) -> float:
         """Read a metric value."""
-        if metric in self.metrics:
-            return self.metrics[metric].value
-        return 0.0
+        i = self._idx.get(metric)
+        return float(self._val[i]) if i is not None else 0.0
 
     def read_all(self) -> Dict[str, float]:
-        """Read all metric values."""
-        return {name: m.value for name, m in self.metrics.items()}
+        """Read all metric values as a dict (slow path; see read_array)."""
+        # tolist() materializes the floats in one C loop
+        return dict(zip(self._names, self._val.tolist()))
+
+    def make_reader(self, metric: str) -> Callable[[], float]:
+        """Return a zero-arg reader bound to one metric.
+
+        The metric index is resolved once here, so each call is a single
+        array access instead of a name lookup — handy for registering
+        per-state readers on the engine.
+        """
+        val = self._val
+        idx = self._idx[metric]
+        return lambda: float(val[idx])
+
+    def read_array(self) -> np.ndarray:
+        """Read all metric values as an array, ordered as metric_names.
+
+        Returns a live view of the value array (no copy); callers that
+        need a stable snapshot should copy it themselves.
+        """
+        return self._val
+
+    def _compile_action(self, effects: Dict[str, float],
+                        param_fn: Callable[[Dict[str, int]], float]) -> tuple:
+        """Compile a linear action into (indices, coefficients, param getter).
+
+        The effect pattern of a linear action is fixed at setup time, so
+        applying it reduces to one indexed update over the target array
+        instead of a chain of per-metric apply_effect calls.
+        """
+        idx = np.array([self._idx[name] for name in effects], dtype=np.intp)
+        coef = np.array(list(effects.values()), dtype=np.float32)
+        return idx, coef, param_fn
 
     def apply_action(self, action: str, parameters: Dict[str, int]) -> bool:
         """Apply an action to the system."""
-        if self.scenario == "thermostat":
-            return self._apply_thermostat_action(action, parameters)
-        elif self.scenario == "load_balancer":
-            return self._apply_load_balancer_action(action, parameters)
-        elif self.scenario == "frame_optimizer":
-            return self._apply_frame_action(action, parameters)
-        return False
-
-    def _apply_thermostat_action(self, action: str, params: Dict[str, int]) -> bool:
-        """Apply thermostat actions."""
-        level = params.get("amount", params.get("level", 1))
-
-        if action == "increase_fan":
-            self.metrics["fan_speed"].apply_effect(level * 10)
-            # Fan increase -> temperature decrease
-            self.metrics["temperature"].apply_effect(-level * 3)
-            return True
-
-        elif action == "decrease_fan":
-            self.metrics["fan_speed"].apply_effect(-level * 10)
-            # Fan decrease -> temperature increase
-            self.metrics["temperature"].apply_effect(level * 2)
-            return True
-
-        elif action == "emergency_cooling":
-            self.metrics["fan_speed"].set_target(100)
-            self.metrics["temperature"].apply_effect(-15)
+        entry = self._action_tbl.get(action)
+        if entry is not None:
+            idx, coef, param_fn = entry
+            self._tgt[idx] = np.clip(self._tgt[idx] + coef * param_fn(parameters),
+                                     self._min[idx], self._max[idx])
             return True
+        fn = self._actions.get(action)
+        return fn(parameters) if fn else False
 
-        return False
+    # Actions with behavior beyond a fixed linear effect pattern
 
-    def _apply_load_balancer_action(self, action: str, params: Dict[str, int]) -> bool:
-        """Apply load balancer actions."""
-        if action == "scale_up":
-            lanes = params.get("lanes", 1)
-            self.metrics["active_lanes"].apply_effect(lanes)
-            self.metrics["cpu_usage"].apply_effect(-lanes * 10)
-            self.metrics["queue_depth"].apply_effect(-lanes * 500)
-            return True
-
-        elif action == "scale_down":
-            lanes = params.get("lanes", 1)
-            self.metrics["active_lanes"].apply_effect(-lanes)
-            self.metrics["cpu_usage"].apply_effect(lanes * 8)
-            return True
-
-        elif action == "shed_load":
-            percent = params.get("percent", 10)
-            self.metrics["queue_depth"].apply_effect(-percent * 100)
-            self.metrics["cpu_usage"].apply_effect(-percent * 2)
-            return True
-
-        elif action == "throttle":
-            self.metrics["cpu_usage"].apply_effect(-15)
-            self.metrics["latency_p95"].apply_effect(20)
-            return True
-
-        elif action == "free_cache":
-            self.metrics["memory_usage"].apply_effect(-15)
-            self.metrics["latency_p95"].apply_effect(5)
-            return True
+    def _act_emergency_cooling(self, params: Dict[str, int]) -> bool:
+        self.metrics["fan_speed"].set_target(100)
+        self.metrics["temperature"].apply_effect(-15)
+        return True
 
-        return False
-
-    def _apply_frame_action(self, action: str, params: Dict[str, int]) -> bool:
-        """Apply frame optimizer actions."""
-        if action == "increase_quality":
-            self.metrics["render_quality"].apply_effect(1)
-            self.metrics["gpu_usage"].apply_effect(15)
-            self.metrics["fps"].apply_effect(-10)
-            return True
-
-        elif action == "decrease_quality":
-            self.metrics["render_quality"].apply_effect(-1)
-            self.metrics["gpu_usage"].apply_effect(-12)
-            self.metrics["fps"].apply_effect(8)
-            return True
-
-        elif action == "flush_vram":
-            self.metrics["vram_usage"].apply_effect(-20)
-            self.metrics["frame_time"].apply_effect(5)
-            return True
-
-        elif action == "dynamic_resolution":
-            scale = params.get("scale", 75) / 100.0
-            self.metrics["gpu_usage"].apply_effect(-(1 - scale) * 30)
-            self.metrics["fps"].apply_effect((1 - scale) * 20)
-            return True
-
-        return False
+    def _act_dynamic_resolution(self, params: Dict[str, int]) -> bool:
+        scale = params.get("scale", 75) / 100.0
+        self.metrics["gpu_usage"].apply_effect(-(1 - scale) * 30)
+        self.metrics["fps"].apply_effect((1 - scale) * 20)
+        return True
 
     def tick(self) -> Dict[str, float]:
         """Advance simulation by one tick."""
         self.tick_count += 1
 
         # Apply scenario-specific physics
-        self._apply_physics()
-
-        # Update all metrics
-        for metric in self.metrics.values():
-            metric.tick()
+        self._physics_fn()
+
+        # Update all metrics in one pass: inertia (gradual approach to
+        # target), drift, noise, then clamp. All intermediates go through
+        # the preallocated scratch buffers.
+        self._rng.random(out=self._rand_buf, dtype=np.float32)
+        self._rand_buf *= 2.0
+        self._rand_buf -= 1.0
+        if NUMBA_AVAILABLE:
+            _tick_kernel(self._val, self._tgt, self._min, self._max,
+                         self._noise, self._drift, self._inertia,
+                         self._rand_buf)
+        else:
+            np.subtract(self._tgt, self._val, out=self._diff)
+            self._diff *= (1 - self._inertia)
+            self._val += self._diff
+            self._val += self._drift
+            np.multiply(self._val, self._noise, out=self._noise_buf)
+            self._noise_buf *= 0.01
+            self._noise_buf *= self._rand_buf
+            self._val += self._noise_buf
+            np.clip(self._val, self._min, self._max, out=self._val)
 
         return self.read_all()
 
-    def _apply_physics(self) -> None:
-        """Apply physics relationships between metrics."""
-        if self.scenario == "thermostat":
-            # Higher fan speed -> lower temperature drift
-            fan = self.metrics["fan_speed"].value
-            self.metrics["temperature"].drift = 0.3 - (fan / 100) * 0.4
-
-        elif self.scenario == "load_balancer":
-            # Higher CPU usage -> higher latency
-            cpu = self.metrics["cpu_usage"].value
-            self.metrics["latency_p95"].drift = cpu * 0.1
-
-            # Queue depth affects CPU
-            queue = self.metrics["queue_depth"].value
-            self.metrics["cpu_usage"].drift = 0.1 + (queue / 20000) * 0.5
-
-        elif self.scenario == "frame_optimizer":
-            # GPU usage inversely affects FPS
-            gpu = self.metrics["gpu_usage"].value
-            self.metrics["fps"].drift = -gpu * 0.02
-
-            # FPS and frame_time are inversely related
-            fps = self.metrics["fps"].value
-            if fps > 0:
-                self.metrics["frame_time"].set_target(1000 / fps)
+    def _physics_thermostat(self) -> None:
+        """Higher fan speed -> lower temperature drift."""
+        self._drift[self._i_temp] = 0.3 - (self._val[self._i_fan] / 100.0) * 0.4
+
+    def _physics_load_balancer(self) -> None:
+        """CPU usage drives latency; queue depth drives CPU."""
+        self._drift[self._i_latency] = self._val[self._i_cpu] * 0.1
+        self._drift[self._i_cpu] = 0.1 + (self._val[self._i_queue] / 20000) * 0.5
+
+    def _physics_frame_optimizer(self) -> None:
+        """GPU usage drags FPS down; frame_time tracks 1000/fps."""
+        self._drift[self._i_fps] = -self._val[self._i_gpu] * 0.02
+
+        fps = self._val[self._i_fps]
+        if fps > 0:
+            i = self._i_frame_time
+            self._tgt[i] = max(self._min[i], min(self._max[i], 1000.0 / fps))
 
     def inject_event(self, event: str) -> None:
         """Inject a simulated event (spike, chaos, etc.)."""
@@ -5,13 +5,22 @@ This connector interfaces with the operating system to read real metrics.
 Works on Windows, Linux, and macOS.
 """
 
+import logging
+import math
 import os
 import platform
-from typing import Dict, List, Any, Optional
+import time
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from .base import SensorConnector, ConnectorInfo
 
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between repeated warnings for the same metric, so an
+# error storm in a tight poll loop doesn't stall on synchronous stdout.
+_ERR_COOLDOWN = 1.0
+
 # Try to import psutil for cross-platform metrics
 try:
     import psutil
@@ -19,22 +28,52 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# Platform is fixed for the process lifetime; resolve it once instead of
+# calling platform.system() on every get_info()/disk read.
+_PLATFORM = platform.system()
+_DISK_ROOT = "C:\\" if _PLATFORM == "Windows" else "/"
+
 
 class SystemConnector(SensorConnector):
     """Connector for reading system metrics (CPU, memory, disk, etc.)."""
 
-    def __init__(self):
+    def __init__(self, ttl: float = 0.1):
         self._connected = False
-        self._cache: Dict[str, float] = {}
+        # Per-metric cache of (monotonic timestamp, value); reads within
+        # the TTL window are served from here instead of hitting psutil.
+        self._ttl = ttl
+        self._cache: Dict[str, Tuple[float, float]] = {}
+        # CPU count is static for the process lifetime, so the metric
+        # list can be built once instead of per call.
+        self._metrics_list = self._build_metrics_list()
+        # Metric name -> zero-arg reader, built on connect(); avoids the
+        # per-read split('.') and branch chain.
+        self._reader_table: Dict[str, Callable[[], float]] = {}
+        # Shared psutil snapshots: one virtual_memory()/disk_usage() call
+        # serves all derived metrics within the TTL window.
+        self._mem_snap = None
+        self._mem_ts = 0.0
+        self._disk_snap = None
+        self._disk_ts = 0.0
+        # Last warning timestamp per metric, for rate-limited logging.
+        self._last_err_ts: Dict[str, float] = {}
 
     def connect(self) -> bool:
         """Check if system metrics are available."""
         self._connected = PSUTIL_AVAILABLE
+        if self._connected:
+            # Prime psutil's non-blocking CPU counters: with interval=None
+            # cpu_percent returns the usage since the previous call, so
+            # the first call just establishes the baseline.
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(interval=None, percpu=True)
+            self._reader_table = self._build_reader_table()
         return self._connected
 
     def disconnect(self) -> None:
         """Nothing to disconnect."""
         self._connected = False
+        self._cache.clear()
 
     def is_connected(self) -> bool:
         return self._connected and PSUTIL_AVAILABLE
@@ -46,13 +85,17 @@ class SystemConnector(SensorConnector):
             description="Reads system metrics (CPU, memory, disk)",
             metrics=self.get_available_metrics(),
             metadata={
-                "platform": platform.system(),
+                "platform": _PLATFORM,
                 "psutil_available": PSUTIL_AVAILABLE,
             }
         )
 
     def get_available_metrics(self) -> List[str]:
         """List available system metrics."""
+        return self._metrics_list
+
+    def _build_metrics_list(self) -> List[str]:
+        """Build the metric list once (CPU count doesn't change)."""
         metrics = [
             "cpu.percent",
             "cpu.count",
@@ -73,91 +116,100 @@ class SystemConnector(SensorConnector):
 
         return metrics
 
+    def _build_reader_table(self) -> Dict[str, Callable[[], float]]:
+        """Map each metric name directly to a zero-arg psutil reader."""
+        def per_cpu(idx: int) -> Callable[[], float]:
+            def read_one() -> float:
+                percents = psutil.cpu_percent(interval=None, percpu=True)
+                return percents[idx] if idx < len(percents) else 0.0
+            return read_one
+
+        table: Dict[str, Callable[[], float]] = {
+            "cpu.percent": lambda: psutil.cpu_percent(interval=None),
+            "cpu.count": lambda: float(psutil.cpu_count()),
+            "cpu.freq": self._read_cpu_freq,
+            "memory.percent": lambda: self._memory().percent,
+            "memory.used_gb": lambda: self._memory().used / (1024 ** 3),
+            "memory.available_gb": lambda: self._memory().available / (1024 ** 3),
+            "memory.total_gb": lambda: self._memory().total / (1024 ** 3),
+            "disk.percent": lambda: self._disk().percent,
+            "disk.used_gb": lambda: self._disk().used / (1024 ** 3),
+            "disk.free_gb": lambda: self._disk().free / (1024 ** 3),
+            "disk.total_gb": lambda: self._disk().total / (1024 ** 3),
+        }
+        for i in range(psutil.cpu_count()):
+            table[f"cpu.{i}.percent"] = per_cpu(i)
+        return table
+
+    @staticmethod
+    def _read_cpu_freq() -> float:
+        freq = psutil.cpu_freq()
+        return freq.current if freq else 0.0
+
+    def _memory(self, refresh: bool = False):
+        """Get the virtual_memory snapshot, refreshed at most once per TTL."""
+        now = time.monotonic()
+        if refresh or self._mem_snap is None or now - self._mem_ts >= self._ttl:
+            self._mem_snap = psutil.virtual_memory()
+            self._mem_ts = now
+        return self._mem_snap
+
+    def _disk(self, refresh: bool = False):
+        """Get the disk_usage snapshot, refreshed at most once per TTL."""
+        now = time.monotonic()
+        if refresh or self._disk_snap is None or now - self._disk_ts >= self._ttl:
+            self._disk_snap = psutil.disk_usage(_DISK_ROOT)
+            self._disk_ts = now
+        return self._disk_snap
+
     def read(self, metric: str) -> float:
-        """Read a single metric."""
+        """Read a single metric (memoized for self._ttl seconds)."""
         if not self.is_connected():
             return 0.0
 
-        parts = metric.split(".")
+        now = time.monotonic()
+        hit = self._cache.get(metric)
+        if hit is not None and now - hit[0] < self._ttl:
+            return hit[1]
 
         try:
-            if parts[0] == "cpu":
-                return self._read_cpu(parts[1:])
-            elif parts[0] == "memory":
-                return self._read_memory(parts[1:])
-            elif parts[0] == "disk":
-                return self._read_disk(parts[1:])
+            fn = self._reader_table.get(metric)
+            value = fn() if fn is not None else 0.0
         except Exception as e:
-            print(f"Error reading {metric}: {e}")
+            # NaN lets callers distinguish "read failed" from a real zero.
+            value = math.nan
+            if now - self._last_err_ts.get(metric, 0.0) >= _ERR_COOLDOWN:
+                self._last_err_ts[metric] = now
+                logger.warning("Error reading %s: %s", metric, e)
 
-        return 0.0
+        self._cache[metric] = (now, value)
+        return value
 
     def read_all(self) -> Dict[str, float]:
-        """Read all metrics."""
-        result = {}
-        for metric in self.get_available_metrics():
-            result[metric] = self.read(metric)
+        """Read all metrics, hitting each psutil source exactly once."""
+        if not self.is_connected():
+            return {}
+
+        freq = psutil.cpu_freq()
+        mem = self._memory(refresh=True)
+        disk = self._disk(refresh=True)
+        per_cpu = psutil.cpu_percent(interval=None, percpu=True)
+
+        result = {
+            "cpu.percent": psutil.cpu_percent(interval=None),
+            "cpu.count": float(psutil.cpu_count()),
+            "cpu.freq": freq.current if freq else 0.0,
+            "memory.percent": mem.percent,
+            "memory.used_gb": mem.used / (1024 ** 3),
+            "memory.available_gb": mem.available / (1024 ** 3),
+            "disk.percent": disk.percent,
+            "disk.used_gb": disk.used / (1024 ** 3),
+            "disk.free_gb": disk.free / (1024 ** 3),
+        }
+        for i, percent in enumerate(per_cpu):
+            result[f"cpu.{i}.percent"] = percent
         return result
 
-    def _read_cpu(self, parts: List[str]) -> float:
-        """Read CPU metrics."""
-        if not parts:
-            return 0.0
-
-        if parts[0] == "percent":
-            return psutil.cpu_percent(interval=0.1)
-        elif parts[0] == "count":
-            return float(psutil.cpu_count())
-        elif parts[0] == "freq":
-            freq = psutil.cpu_freq()
-            return freq.current if freq else 0.0
-        elif parts[0].isdigit():
-            # Per-CPU percentage
-            cpu_idx = int(parts[0])
-            percents = psutil.cpu_percent(interval=0.1, percpu=True)
-            if cpu_idx < len(percents):
-                return percents[cpu_idx]
-
-        return 0.0
-
-    def _read_memory(self, parts: List[str]) -> float:
-        """Read memory metrics."""
-        if not parts:
-            return 0.0
-
-        mem = psutil.virtual_memory()
-
-        if parts[0] == "percent":
-            return mem.percent
-        elif parts[0] == "used_gb":
-            return mem.used / (1024 ** 3)
-        elif parts[0] == "available_gb":
-            return mem.available / (1024 ** 3)
-        elif parts[0] == "total_gb":
-            return mem.total / (1024 ** 3)
-
-        return 0.0
-
-    def _read_disk(self, parts: List[str]) -> float:
-        """Read disk metrics."""
-        if not parts:
-            return 0.0
-
-        # Use root partition by default
-        path = "/" if platform.system() != "Windows" else "C:\\"
-        disk = psutil.disk_usage(path)
-
-        if parts[0] == "percent":
-            return disk.percent
-        elif parts[0] == "used_gb":
-            return disk.used / (1024 ** 3)
-        elif parts[0] == "free_gb":
-            return disk.free / (1024 ** 3)
-        elif parts[0] == "total_gb":
-            return disk.total / (1024 ** 3)
-
-        return 0.0
-
 
 # Optional GPU connector (requires pynvml for NVIDIA)
 class GPUConnector(SensorConnector):
@@ -166,6 +218,12 @@ class GPUConnector(SensorConnector):
     def __init__(self):
         self._connected = False
         self._nvml_available = False
+        self._metrics_list: List[str] = []
+        # Device handles acquired once on connect(); NVML handle lookup
+        # is comparatively expensive and handles stay valid until shutdown.
+        self._handles: List[Any] = []
+        # Last warning timestamp per metric, for rate-limited logging.
+        self._last_err_ts: Dict[str, float] = {}
 
         try:
             import pynvml
@@ -181,6 +239,18 @@ class GPUConnector(SensorConnector):
         try:
             self._nvml.nvmlInit()
             self._connected = True
+            count = self._nvml.nvmlDeviceGetCount()
+            self._handles = [self._nvml.nvmlDeviceGetHandleByIndex(i)
+                             for i in range(count)]
+            self._metrics_list = []
+            for i in range(count):
+                self._metrics_list.extend([
+                    f"gpu.{i}.temperature",
+                    f"gpu.{i}.utilization",
+                    f"gpu.{i}.memory_used_mb",
+                    f"gpu.{i}.memory_total_mb",
+                    f"gpu.{i}.power_draw_w",
+                ])
             return True
         except Exception:
             return False
@@ -192,6 +262,7 @@ class GPUConnector(SensorConnector):
             except Exception:
                 pass
         self._connected = False
+        self._handles = []
 
     def is_connected(self) -> bool:
         return self._connected
@@ -208,14 +279,7 @@ class GPUConnector(SensorConnector):
     def get_available_metrics(self) -> List[str]:
         if not self._connected:
             return []
-
-        return [
-            "gpu.0.temperature",
-            "gpu.0.utilization",
-            "gpu.0.memory_used_mb",
-            "gpu.0.memory_total_mb",
-            "gpu.0.power_draw_w",
-        ]
+        return self._metrics_list
 
     def read(self, metric: str) -> float:
         if not self._connected:
@@ -227,7 +291,9 @@ class GPUConnector(SensorConnector):
 
         try:
             gpu_idx = int(parts[1])
-            handle = self._nvml.nvmlDeviceGetHandleByIndex(gpu_idx)
+            if gpu_idx >= len(self._handles):
+                return 0.0
+            handle = self._handles[gpu_idx]
 
             if parts[2] == "temperature":
                 return float(self._nvml.nvmlDeviceGetTemperature(
@@ -245,12 +311,38 @@ class GPUConnector(SensorConnector):
                 return self._nvml.nvmlDeviceGetPowerUsage(handle) / 1000.0
 
         except Exception as e:
-            print(f"Error reading GPU metric {metric}: {e}")
+            self._warn(metric, f"Error reading GPU metric {metric}: {e}")
+            return math.nan
 
         return 0.0
 
+    def _warn(self, key: str, message: str) -> None:
+        """Log a warning, suppressing duplicates for the same key within 1s."""
+        now = time.monotonic()
+        if now - self._last_err_ts.get(key, 0.0) >= _ERR_COOLDOWN:
+            self._last_err_ts[key] = now
+            logger.warning(message)
+
     def read_all(self) -> Dict[str, float]:
+        """Read all GPU metrics with one NVML query per data source."""
         result = {}
-        for metric in self.get_available_metrics():
-            result[metric] = self.read(metric)
+        if not self._connected:
+            return result
+
+        for i, handle in enumerate(self._handles):
+            try:
+                temp = self._nvml.nvmlDeviceGetTemperature(
+                    handle, self._nvml.NVML_TEMPERATURE_GPU)
+                util = self._nvml.nvmlDeviceGetUtilizationRates(handle)
+                mem = self._nvml.nvmlDeviceGetMemoryInfo(handle)
+                power = self._nvml.nvmlDeviceGetPowerUsage(handle)
+            except Exception as e:
+                self._warn(f"gpu.{i}", f"Error reading GPU {i} metrics: {e}")
+                continue
+
+            result[f"gpu.{i}.temperature"] = float(temp)
+            result[f"gpu.{i}.utilization"] = float(util.gpu)
+            result[f"gpu.{i}.memory_used_mb"] = mem.used / (1024 ** 2)
+            result[f"gpu.{i}.memory_total_mb"] = mem.total / (1024 ** 2)
+            result[f"gpu.{i}.power_draw_w"] = power / 1000.0
         return result
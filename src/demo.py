@@ -12,12 +12,8 @@ Run: python -m src.demo
 """
 
 import time
-import sys
 import os
 
-# Add parent to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.parser import parse_file
 from src.runtime import Engine, EngineConfig
 from src.connectors import SimulatedSystem
@@ -31,12 +27,23 @@ def print_header(text: str) -> None:
     print("=" * 60)
 
 
+# Format strings for the state line, precompiled per key tuple so each
+# print_status call does one .format() instead of N f-string allocations.
+_STATE_FMT: dict = {}
+
+
 def print_status(engine: Engine, sim: SimulatedSystem) -> None:
     """Print current status."""
     status = engine.get_status()
+    state = status['state']
+
+    keys = tuple(state)
+    fmt = _STATE_FMT.get(keys)
+    if fmt is None:
+        fmt = _STATE_FMT[keys] = ", ".join(f"{k}={{:.1f}}" for k in keys)
 
-    print(f"\n--- Tick {engine._tick_count} ---")
-    print(f"State: {', '.join(f'{k}={v:.1f}' for k, v in status['state'].items())}")
+    print(f"\n--- Tick {engine.tick_count} ---")
+    print("State: " + fmt.format(*state.values()))
 
     if status['violations']:
         print(f"VIOLATIONS: {status['violations']}")
@@ -78,10 +85,10 @@ def demo_thermostat():
     # 4. Connect simulation to engine
     print("\n[4] Connecting simulation...")
 
-    # State readers
-    engine.register_state_reader("temperature", lambda: sim.read("temperature"))
-    engine.register_state_reader("target", lambda: sim.read("target"))
-    engine.register_state_reader("fan_speed", lambda: sim.read("fan_speed"))
+    # State readers (pre-bound to the metric, no per-tick name lookup)
+    engine.register_state_reader("temperature", sim.make_reader("temperature"))
+    engine.register_state_reader("target", sim.make_reader("target"))
+    engine.register_state_reader("fan_speed", sim.make_reader("fan_speed"))
 
     # Action handlers
     engine.register_action_handler("increase_fan",
@@ -134,7 +141,7 @@ def demo_load_balancer():
 
     # Connect
     for state in ["cpu_usage", "memory_usage", "queue_depth", "latency_p95", "active_lanes"]:
-        engine.register_state_reader(state, lambda s=state: sim.read(s))
+        engine.register_state_reader(state, sim.make_reader(state))
 
     for action in ["scale_up", "scale_down", "shed_load", "throttle", "free_cache"]:
         engine.register_action_handler(action, lambda p, a=action: sim.apply_action(a, p))
@@ -213,16 +220,16 @@ Advantages:
     sim.metrics["fan_speed"].value = 90
 
     engine = Engine(system, EngineConfig(action_threshold=0.1))
-    engine.register_state_reader("temperature", lambda: sim.read("temperature"))
-    engine.register_state_reader("fan_speed", lambda: sim.read("fan_speed"))
-    engine.register_state_reader("target", lambda: sim.read("target"))
+    engine.register_state_reader("temperature", sim.make_reader("temperature"))
+    engine.register_state_reader("fan_speed", sim.make_reader("fan_speed"))
+    engine.register_state_reader("target", sim.make_reader("target"))
 
     # Single tick
     engine.read_states()
     result = engine.tick()
 
     print(f"State: temp={sim.read('temperature'):.1f}, fan={sim.read('fan_speed'):.1f}")
-    print(f"Constraints: {[(c.constraint.name, c.margin) for c in engine.scorer.check_constraints()]}")
+    print(f"Constraints: {[(c.constraint.name, c.margin) for c in engine.scorer.check_constraints()[0]]}")
     print(f"\nNovaIR decision: {result.selected_action}")
     print(f"\nExplanation:\n{engine.explain_decision()}")
 
@@ -264,8 +271,10 @@ The system made autonomous decisions based on:
         print(f"Details: {e}")
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        # Full traceback only on request; keeps scripted runs quiet
+        if os.environ.get("NOVAIR_DEBUG"):
+            import traceback
+            traceback.print_exc()
 
 
 if __name__ == "__main__":
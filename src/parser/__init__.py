@@ -1,6 +1,10 @@
 # NovaIR Parser
 # A basic parser for the NovaIR declarative DSL
 
+import copy
+import os
+from functools import lru_cache
+
 from .lexer import Lexer, Token, TokenType
 from .parser import Parser
 from .ast import (
@@ -18,16 +22,27 @@ __all__ = [
 ]
 
 
-def parse_file(filepath: str) -> "System":
-    """Parse a .novair file and return the AST."""
+@lru_cache(maxsize=128)
+def _parse_file_cached(filepath: str, mtime_ns: int, size: int) -> "System":
+    """Parse a file, memoized on (path, mtime_ns, size)."""
     with open(filepath, "r", encoding="utf-8") as f:
         source = f.read()
     return parse_string(source)
 
 
+def parse_file(filepath: str) -> "System":
+    """Parse a .novair file and return the AST.
+
+    Repeated parses of an unchanged file (same mtime and size) skip
+    lexing and parsing entirely. The cached AST is deep-copied on
+    return because callers (e.g. the Engine) may annotate it.
+    """
+    st = os.stat(filepath)
+    return copy.deepcopy(_parse_file_cached(filepath, st.st_mtime_ns, st.st_size))
+
+
 def parse_string(source: str) -> "System":
     """Parse a NovaIR source string and return the AST."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    return parser.parse()
+    # Stream tokens straight into the parser; the token list is never
+    # materialized, keeping peak memory flat on large sources.
+    return Parser(Lexer(source).tokens_iter()).parse()
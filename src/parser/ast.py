@@ -4,72 +4,135 @@ NovaIR Abstract Syntax Tree (AST) definitions.
 This module defines the data structures that represent a parsed NovaIR program.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Literal
-from enum import Enum
+from typing import Dict, Iterator, List, Optional, Literal, Tuple
+from enum import IntEnum
 
+import numpy as np
 
-class Severity(Enum):
-    """Constraint severity levels."""
-    CRITICAL = "critical"
-    WARNING = "warning"
 
+# IntEnum so hot-path comparisons (e.g. severity == CRITICAL in the
+# scorer) fall through to C-level int compares, and so the values can be
+# stored directly in the SystemView arrays. Each enum keeps a `label`
+# property for the lowercase source-level spelling.
 
-class CostLevel(Enum):
+class Severity(IntEnum):
+    """Constraint severity levels; ordered so max() picks the worst."""
+    WARNING = 1
+    CRITICAL = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class CostLevel(IntEnum):
     """Action cost levels."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
 
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
-class ObjectiveType(Enum):
+
+class ObjectiveType(IntEnum):
     """Objective optimization types."""
-    TARGET = "target"
-    MIN = "min"
-    MAX = "max"
+    TARGET = 1
+    MIN = 2
+    MAX = 3
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
 
-class TickMode(Enum):
+class TickMode(IntEnum):
     """Tick execution modes."""
-    CONTINUOUS = "continuous"
-    REACTIVE = "reactive"
+    CONTINUOUS = 1
+    REACTIVE = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+# Operator encoding shared with SystemView consumers (scorer kernels)
+OP_CODES: Dict[str, int] = {"<=": 0, ">=": 1, "<": 2, ">": 3, "==": 4, "!=": 5}
+
+@dataclass(slots=True)
+class SystemView:
+    """Structure-of-arrays view of a System's constraints.
 
+    The AST keeps constraints as a list of objects; evaluating them per
+    tick means chasing several attributes per node. This view packs the
+    hot fields into parallel arrays so the scorer can evaluate every
+    constraint in a few vectorized operations.
+    """
+    state_names: Tuple[str, ...]
+    state_index: Dict[str, int]
+    constraint_metric_idx: np.ndarray  # int32, index into state_names
+    constraint_op: np.ndarray          # int8, OP_CODES values
+    constraint_threshold: np.ndarray   # float64
+    constraint_severity: np.ndarray    # int8, 2=critical, 1=warning
 
-@dataclass
+
+@dataclass(slots=True, unsafe_hash=True)
 class SourcePath:
     """A source path like 'sensors.cpu.temp'."""
-    parts: List[str]
+    parts: Tuple[str, ...]
+    _str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Tuple of interned parts keeps the path hashable for use as a
+        # cache key; the joined form is precomputed since it never changes.
+        self.parts = tuple(sys.intern(p) for p in self.parts)
+        self._str = ".".join(self.parts)
 
     def __str__(self) -> str:
-        return ".".join(self.parts)
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValueWithUnit:
-    """A numeric value with optional unit like '85°C' or '100%'."""
+    """A numeric value with optional unit like '85°C' or '100%'.
+
+    Frozen because the parser shares one node per distinct literal.
+    """
     value: float
     unit: Optional[str] = None
 
+    def __post_init__(self):
+        # Units like "°C" repeat across thousands of nodes but aren't
+        # covered by CPython's automatic interning (non-ASCII).
+        if self.unit is not None:
+            object.__setattr__(self, "unit", sys.intern(self.unit))
+
     def __str__(self) -> str:
         if self.unit:
             return f"{self.value}{self.unit}"
         return str(self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class Effect:
     """An action effect like 'temperature: -5°C to -15°C'."""
     metric: str
     min_effect: ValueWithUnit
     max_effect: Optional[ValueWithUnit] = None  # None if single value
 
+    def __post_init__(self):
+        self.metric = sys.intern(self.metric)
+
     def __str__(self) -> str:
         if self.max_effect:
             return f"{self.metric}: {self.min_effect} to {self.max_effect}"
         return f"{self.metric}: {self.min_effect}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     """An action parameter like 'level: 1..5'."""
     name: str
@@ -80,17 +143,20 @@ class Parameter:
         return f"{self.name}: {self.min_value}..{self.max_value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """A state binding like 'temperature <- sensors.cpu.temp'."""
     name: str
     source: SourcePath
 
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
+
     def __str__(self) -> str:
         return f"{self.name} <- {self.source}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     """A constraint declaration."""
     name: str
@@ -99,11 +165,14 @@ class Constraint:
     value: ValueWithUnit
     severity: Severity
 
+    def __post_init__(self):
+        self.metric = sys.intern(self.metric)
+
     def __str__(self) -> str:
-        return f"{self.name}: {self.metric} {self.operator} {self.value} @{self.severity.value}"
+        return f"{self.name}: {self.metric} {self.operator} {self.value} @{self.severity.label}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Objective:
     """An objective declaration."""
     name: str
@@ -112,33 +181,55 @@ class Objective:
     target_value: Optional[ValueWithUnit] = None  # Only for TARGET type
     priority: int = 5
 
+    def __post_init__(self):
+        self.metric = sys.intern(self.metric)
+
     def __str__(self) -> str:
         if self.type == ObjectiveType.TARGET:
             return f"{self.name}: {self.metric} -> target({self.target_value}) @priority({self.priority})"
-        return f"{self.name}: {self.metric} -> {self.type.value} @priority({self.priority})"
+        return f"{self.name}: {self.metric} -> {self.type.label} @priority({self.priority})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """An action declaration."""
     name: str
     parameters: List[Parameter] = field(default_factory=list)
     effects: List[Effect] = field(default_factory=list)
     cost: CostLevel = CostLevel.LOW
+    # Lazily cached __str__ result; nodes are not mutated after parse.
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _effects_by_metric: Dict[str, Effect] = field(init=False, repr=False, compare=False)
 
-    def __str__(self) -> str:
-        lines = [f"{self.name}:"]
+    def __post_init__(self):
+        self._effects_by_metric = {e.metric: e for e in self.effects}
+
+    def effect_on(self, metric: str) -> Optional[Effect]:
+        """Look up this action's effect on a metric, if any (O(1))."""
+        return self._effects_by_metric.get(metric)
+
+    def _emit_lines(self, indent: str = "") -> Iterator[str]:
+        """Yield the rendered lines, already prefixed with `indent`.
+
+        Lets System.__str__ embed actions without the str() + split("\n")
+        + re-indent roundtrip.
+        """
+        yield f"{indent}{self.name}:"
         if self.parameters:
             params_str = ", ".join(str(p) for p in self.parameters)
-            lines.append(f"  parameters: [{params_str}]")
-        lines.append("  effects:")
+            yield f"{indent}  parameters: [{params_str}]"
+        yield f"{indent}  effects:"
         for effect in self.effects:
-            lines.append(f"    {effect}")
-        lines.append(f"  cost: {self.cost.value}")
-        return "\n".join(lines)
+            yield f"{indent}    {effect}"
+        yield f"{indent}  cost: {self.cost.label}"
+
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = "\n".join(self._emit_lines())
+        return self._str
 
 
-@dataclass
+@dataclass(slots=True)
 class Tick:
     """Tick configuration."""
     interval_ms: int = 100
@@ -146,10 +237,10 @@ class Tick:
     mode: TickMode = TickMode.CONTINUOUS
 
     def __str__(self) -> str:
-        return f"tick:\n  interval: {self.interval_ms} ms\n  action_threshold: {self.action_threshold}\n  mode: {self.mode.value}"
+        return f"tick:\n  interval: {self.interval_ms} ms\n  action_threshold: {self.action_threshold}\n  mode: {self.mode.label}"
 
 
-@dataclass
+@dataclass(slots=True)
 class System:
     """The root AST node representing a complete NovaIR program."""
     name: str
@@ -159,8 +250,42 @@ class System:
     objectives: List[Objective] = field(default_factory=list)
     actions: List[Action] = field(default_factory=list)
     tick: Optional[Tick] = None
+    # Lazily cached __str__ result; nodes are not mutated after parse.
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _view: Optional[SystemView] = field(default=None, init=False, repr=False, compare=False)
+
+    def compile_view(self) -> SystemView:
+        """Build (and cache) the SoA view of this system's constraints."""
+        if self._view is not None:
+            return self._view
+
+        state_names = tuple(s.name for s in self.states)
+        state_index = {name: i for i, name in enumerate(state_names)}
+
+        n = len(self.constraints)
+        metric_idx = np.empty(n, dtype=np.int32)
+        op = np.empty(n, dtype=np.int8)
+        threshold = np.empty(n, dtype=np.float64)
+        severity = np.empty(n, dtype=np.int8)
+        for i, c in enumerate(self.constraints):
+            metric_idx[i] = state_index.get(c.metric, -1)
+            op[i] = OP_CODES[c.operator]
+            threshold[i] = c.value.value
+            severity[i] = int(c.severity)
+
+        self._view = SystemView(
+            state_names=state_names,
+            state_index=state_index,
+            constraint_metric_idx=metric_idx,
+            constraint_op=op,
+            constraint_threshold=threshold,
+            constraint_severity=severity,
+        )
+        return self._view
 
     def __str__(self) -> str:
+        if self._str is not None:
+            return self._str
         lines = [f"system {self.name}"]
         if self.version:
             lines[0] += f' @version("{self.version}")'
@@ -187,15 +312,36 @@ class System:
         if self.actions:
             lines.append("actions:")
             for action in self.actions:
-                action_lines = str(action).split("\n")
-                for line in action_lines:
-                    lines.append(f"  {line}")
+                lines.extend(action._emit_lines("  "))
             lines.append("")
 
         if self.tick:
             lines.append(str(self.tick))
 
-        return "\n".join(lines)
+        self._str = "\n".join(lines)
+        return self._str
+
+    def is_valid(self) -> bool:
+        """Run the same checks as validate() but stop at the first failure.
+
+        The happy path allocates nothing; use validate() when the actual
+        error messages are needed.
+        """
+        if not self.name or not self.states:
+            return False
+        if not self.constraints and not self.objectives:
+            return False
+
+        state_names = {s.name for s in self.states}
+        for constraint in self.constraints:
+            if constraint.metric not in state_names:
+                return False
+        for objective in self.objectives:
+            if objective.metric not in state_names:
+                return False
+            if not 1 <= objective.priority <= 10:
+                return False
+        return True
 
     def validate(self) -> List[str]:
         """Validate the system and return a list of errors (empty if valid)."""
@@ -217,12 +363,10 @@ class System:
             if constraint.metric not in state_names:
                 errors.append(f"Constraint '{constraint.name}' references unknown state '{constraint.metric}'")
 
+        # Metric existence and priority range in a single pass
         for objective in self.objectives:
             if objective.metric not in state_names:
                 errors.append(f"Objective '{objective.name}' references unknown state '{objective.metric}'")
-
-        # Check priority ranges
-        for objective in self.objectives:
             if not 1 <= objective.priority <= 10:
                 errors.append(f"Objective '{objective.name}' has invalid priority {objective.priority} (must be 1-10)")
 
@@ -5,12 +5,8 @@ NovaIR Parser Demo - Demonstrates parsing of NovaIR files.
 Run: python -m src.parser.demo
 """
 
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.parser import parse_string, parse_file
 
 
@@ -90,11 +86,11 @@ tick:
             if action.parameters:
                 print(f"      params: {[str(p) for p in action.parameters]}")
             print(f"      effects: {[str(e) for e in action.effects]}")
-            print(f"      cost: {action.cost.value}")
+            print(f"      cost: {action.cost.label}")
         print()
 
         if system.tick:
-            print(f"Tick: {system.tick.interval_ms}ms, threshold={system.tick.action_threshold}, mode={system.tick.mode.value}")
+            print(f"Tick: {system.tick.interval_ms}ms, threshold={system.tick.action_threshold}, mode={system.tick.mode.label}")
         print()
 
         # Validate
@@ -114,8 +110,10 @@ tick:
 
     except Exception as e:
         print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        # Full traceback only on request; keeps scripted runs quiet
+        if os.environ.get("NOVAIR_DEBUG"):
+            import traceback
+            traceback.print_exc()
 
 
 def demo_parse_file():
@@ -5,13 +5,16 @@ This module breaks down the source text into tokens that the parser can process.
 """
 
 import re
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import List, Optional
+from enum import IntEnum, auto
+from typing import Iterator, List, Optional
 
 
-class TokenType(Enum):
-    """Token types for NovaIR."""
+class TokenType(IntEnum):
+    """Token types for NovaIR; small ints so type checks compare at C level
+    and the values pack into compact buffers if needed."""
     # Keywords
     SYSTEM = auto()
     STATE = auto()
@@ -81,13 +84,18 @@ class TokenType(Enum):
     COMMENT = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Token:
-    """A token with type, value, and position information."""
+    """A token with type, value, and position information.
+
+    NUMBER tokens carry their parsed value in num_value so the parser
+    never re-parses the lexeme string.
+    """
     type: TokenType
     value: str
     line: int
     column: int
+    num_value: float = 0.0
 
     def __str__(self) -> str:
         return f"Token({self.type.name}, {repr(self.value)}, line={self.line})"
@@ -102,6 +110,58 @@ class LexerError(Exception):
         super().__init__(f"Line {line}, column {column}: {message}")
 
 
+# Master token pattern: one C-level regex match per token instead of
+# per-character Python dispatch. Alternative order matters: NUMBER must
+# precede OP so a signed literal wins over a bare '-'/'+'.
+_TOKEN_RE = re.compile(
+    r"(?P<WS>[ \t]+)"
+    r"|(?P<NL>\n)"
+    r"|(?P<COMMENT>#[^\n]*)"
+    r"|(?P<NUMBER>[+-]?\d+(?:\.\d+)?)(?P<UNIT>°[CFK]|%|[A-Za-z][A-Za-z0-9]*)?"
+    r"|(?P<IDENT>[A-Za-z_][A-Za-z0-9_]*)"
+    r'|(?P<STRING>"(?P<STRBODY>[^"\n]*)")'
+    r"|(?P<ANNOT>@[A-Za-z0-9_]*)"
+    r"|(?P<OP><-|->|<=|>=|==|!=|\.\.|[:,.()\[\]<>])",
+    re.ASCII,  # identifiers and digits are ASCII-only by language definition
+)
+
+# Run of leading spaces; always matches (possibly empty)
+_INDENT_RE = re.compile(r" *")
+
+# Any character no token can start with, scanned once up front so the
+# hot loop can assume the source is lexable. Comment and string bodies
+# may contain arbitrary text, so the alternation consumes them first
+# and only group 1 marks a genuine offender.
+_ILLEGAL_RE = re.compile(
+    r'"[^"\n]*"|#[^\n]*|([^ \t\n\w+\-.:,<>=!@#"°%()\[\]])', re.ASCII)
+
+_OP_TYPES = {
+    "<-": TokenType.ARROW_LEFT,
+    "->": TokenType.ARROW_RIGHT,
+    "<=": TokenType.LTE,
+    ">=": TokenType.GTE,
+    "==": TokenType.EQ,
+    "!=": TokenType.NEQ,
+    "..": TokenType.RANGE,
+    ":": TokenType.COLON,
+    ",": TokenType.COMMA,
+    ".": TokenType.DOT,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "[": TokenType.LBRACKET,
+    "]": TokenType.RBRACKET,
+    "<": TokenType.LT,
+    ">": TokenType.GT,
+}
+
+_ANNOTATION_TYPES = {
+    "version": TokenType.VERSION,
+    "critical": TokenType.CRITICAL,
+    "warning": TokenType.WARNING,
+    "priority": TokenType.PRIORITY,
+}
+
+
 class Lexer:
     """Tokenizes NovaIR source code."""
 
@@ -143,256 +203,213 @@ class Lexer:
 
     def __init__(self, source: str):
         self.source = source
-        self.pos = 0
         self.line = 1
-        self.column = 1
         self.tokens: List[Token] = []
-        self.indent_stack = [0]
+        # Pooled indentation stack: preallocated slots plus a top index,
+        # so scope entry/exit doesn't resize a list per block.
+        self._istack = [0] * 32
+        self._itop = 0
+        # Absolute offset of the start of each line; columns are derived
+        # from offsets instead of being counted per token.
+        line_starts = [0]
+        find = source.find
+        i = find("\n")
+        while i != -1:
+            line_starts.append(i + 1)
+            i = find("\n", i + 1)
+        self._line_starts = line_starts
+        self._line_start = 0
+
+    def _linecol(self, pos: int) -> tuple:
+        """Derive (line, column) for an absolute offset via bisect."""
+        line = bisect_right(self._line_starts, pos)
+        return line, pos - self._line_starts[line - 1] + 1
 
     def tokenize(self) -> List[Token]:
         """Tokenize the entire source and return a list of tokens."""
-        self.tokens = []
-        self.indent_stack = [0]
-
-        while self.pos < len(self.source):
-            # Handle line start (indentation)
-            if self.column == 1:
-                self._handle_indentation()
-
-            # Skip whitespace (but not newlines)
-            if self._peek() in " \t" and self.column > 1:
-                self._advance()
-                continue
-
-            # Handle newlines
-            if self._peek() == "\n":
-                self._add_token(TokenType.NEWLINE, "\n")
-                self._advance()
+        tokens = list(self.tokens_iter())
+        self.tokens = tokens
+        return tokens
+
+    def tokens_iter(self) -> Iterator[Token]:
+        """Yield tokens one at a time as they are scanned.
+
+        Streaming counterpart of tokenize(): the parser can pull tokens
+        without the full list ever being materialized. Each physical
+        line gets an indentation pre-pass, then its content is consumed
+        with the master regex.
+        """
+        self._istack = istack = [0] * 32
+        self._itop = itop = 0
+        self.line = 1
+        # Local bindings for the hot loop: attribute and global lookups
+        # cost a dict probe per access in CPython.
+        source = self.source
+        for bad in _ILLEGAL_RE.finditer(source):
+            if bad.lastindex:
+                raise LexerError(f"Unexpected character: {bad.group(1)}",
+                                 *self._linecol(bad.start(1)))
+        n = len(source)
+        match = _TOKEN_RE.match
+        indent_match = _INDENT_RE.match
+        handlers = _HANDLERS
+        make = Token
+        pos = 0
+
+        while pos < n:
+            # Measure indentation (leading spaces) in one C-level match
+            start = line_start = self._line_start = pos
+            pos = indent_match(source, pos).end()
+            indent = pos - start
+
+            # A tab as the first character of a line is the classic
+            # tabs-vs-spaces mistake; fail loudly instead of lexing the
+            # line as indent-0 content.
+            if indent == 0 and pos < n and source[pos] == "\t":
+                raise LexerError("Unexpected character: \t", self.line, 1)
+
+            # Blank and comment-only lines don't affect the indent stack
+            # and carry no tokens besides the NEWLINE, so skip straight to
+            # the end of the line without running the master regex.
+            next_ch = source[pos] if pos < n else ""
+            if next_ch in ("", "\n", "#"):
+                nl = source.find("\n", pos)
+                if nl == -1:
+                    pos = n
+                    continue
+                yield make(TokenType.NEWLINE, "\n", self.line, nl - line_start + 1)
                 self.line += 1
-                self.column = 1
+                pos = nl + 1
                 continue
 
-            # Handle comments
-            if self._peek() == "#":
-                self._skip_comment()
-                continue
+            current = istack[itop]
+            if indent > current:
+                itop += 1
+                if itop == len(istack):
+                    istack.append(indent)
+                else:
+                    istack[itop] = indent
+                yield make(TokenType.INDENT, " " * indent, self.line, 1)
+            elif indent < current:
+                while istack[itop] > indent:
+                    itop -= 1
+                    yield make(TokenType.DEDENT, "", self.line, 1)
+            self._itop = itop
+
+            # Scan line content with the master regex
+            while pos < n:
+                m = match(source, pos)
+                if m is None:
+                    # Every character passed the upfront legality scan, so
+                    # the only failures left are malformed sequences.
+                    if source[pos] == '"':
+                        raise LexerError("Unterminated string", *self._linecol(pos))
+                    raise LexerError(f"Unexpected character: {source[pos]}",
+                                     *self._linecol(pos))
+
+                kind = m.lastgroup
+                text = m.group()
+                start_col = pos - line_start + 1
+                pos = m.end()
+
+                if kind == "NL":
+                    yield make(TokenType.NEWLINE, "\n", self.line, start_col)
+                    self.line += 1
+                    break
+                if kind == "STRING":
+                    # The nested group captures the body without the
+                    # quotes, saving a slice per string literal.
+                    yield make(TokenType.STRING, m.group("STRBODY"),
+                               self.line, start_col)
+                    continue
+                if kind == "NUMBER" or kind == "UNIT":
+                    # UNIT is an optional tail of the NUMBER alternative;
+                    # when it matched, lastgroup reports it instead.
+                    num_text = m.group("NUMBER")
+                    yield make(TokenType.NUMBER, num_text,
+                               self.line, start_col, float(num_text))
+                    if kind == "UNIT":
+                        unit = sys.intern(m.group("UNIT"))
+                        if (unit[0] == "°" or unit == "%"
+                                or unit in self.UNITS
+                                or unit.lower() in ("ms", "s", "m", "h")):
+                            yield make(TokenType.UNIT, unit, self.line,
+                                       m.start("UNIT") - line_start + 1)
+                    continue
+                handler = handlers[kind]
+                if handler is not None:
+                    yield handler(self, text, start_col)
 
-            # Handle operators and punctuation
-            if self._match_operator():
-                continue
+        # Handle remaining dedents
+        while itop > 0:
+            itop -= 1
+            yield make(TokenType.DEDENT, "", self.line, 1)
+        self._itop = 0
 
-            # Handle strings
-            if self._peek() == '"':
-                self._read_string()
-                continue
+        yield Token(TokenType.EOF, "", self.line, 1)
 
-            # Handle numbers (including negative and with units)
-            if self._peek().isdigit() or (self._peek() in "+-" and self._peek_ahead().isdigit()):
-                self._read_number()
-                continue
 
-            # Handle identifiers and keywords
-            if self._peek().isalpha() or self._peek() == "_":
-                self._read_identifier()
-                continue
 
-            # Handle annotations
-            if self._peek() == "@":
-                self._read_annotation()
-                continue
+# Keywords bucketed by length: most identifiers miss on the length probe
+# alone, and lowercase identifiers (the common case) skip the .lower()
+# allocation entirely. Buckets map each keyword to (canonical string,
+# type): the canonical string is the interned dict-key literal, so
+# keyword tokens share one value object instead of a fresh slice per
+# occurrence.
+_KW_BY_LEN: dict = {}
+for _kw, _tt in Lexer.KEYWORDS.items():
+    _KW_BY_LEN.setdefault(len(_kw), {})[_kw] = (_kw, _tt)
 
-            raise LexerError(f"Unexpected character: {self._peek()}", self.line, self.column)
+# Canonical (interned) spellings for operator tokens, same idea.
+_OP_CANON = {op: op for op in _OP_TYPES}
 
-        # Handle remaining dedents
-        while len(self.indent_stack) > 1:
-            self.indent_stack.pop()
-            self._add_token(TokenType.DEDENT, "")
-
-        self._add_token(TokenType.EOF, "")
-        return self.tokens
-
-    def _peek(self) -> str:
-        """Return current character without advancing."""
-        if self.pos >= len(self.source):
-            return "\0"
-        return self.source[self.pos]
-
-    def _peek_ahead(self, offset: int = 1) -> str:
-        """Return character at offset from current position."""
-        pos = self.pos + offset
-        if pos >= len(self.source):
-            return "\0"
-        return self.source[pos]
-
-    def _advance(self) -> str:
-        """Consume and return current character."""
-        char = self._peek()
-        self.pos += 1
-        self.column += 1
-        return char
-
-    def _add_token(self, type: TokenType, value: str):
-        """Add a token to the list."""
-        token = Token(type, value, self.line, self.column - len(value))
-        self.tokens.append(token)
-
-    def _handle_indentation(self):
-        """Handle indentation at the start of a line."""
-        indent = 0
-        while self._peek() == " ":
-            self._advance()
-            indent += 1
-
-        # Skip empty lines
-        if self._peek() in "\n\0#":
-            return
-
-        current_indent = self.indent_stack[-1]
-
-        if indent > current_indent:
-            self.indent_stack.append(indent)
-            self._add_token(TokenType.INDENT, " " * indent)
-        elif indent < current_indent:
-            while self.indent_stack[-1] > indent:
-                self.indent_stack.pop()
-                self._add_token(TokenType.DEDENT, "")
-
-    def _skip_comment(self):
-        """Skip a comment until end of line."""
-        while self._peek() not in "\n\0":
-            self._advance()
-
-    def _match_operator(self) -> bool:
-        """Try to match a multi-char or single-char operator."""
-        # Two-character operators
-        two_char = self.source[self.pos:self.pos + 2]
-        two_char_ops = {
-            "<-": TokenType.ARROW_LEFT,
-            "->": TokenType.ARROW_RIGHT,
-            "<=": TokenType.LTE,
-            ">=": TokenType.GTE,
-            "==": TokenType.EQ,
-            "!=": TokenType.NEQ,
-            "..": TokenType.RANGE,
-        }
-        if two_char in two_char_ops:
-            self._add_token(two_char_ops[two_char], two_char)
-            self._advance()
-            self._advance()
-            return True
-
-        # Single-character operators
-        one_char_ops = {
-            ":": TokenType.COLON,
-            ",": TokenType.COMMA,
-            ".": TokenType.DOT,
-            "(": TokenType.LPAREN,
-            ")": TokenType.RPAREN,
-            "[": TokenType.LBRACKET,
-            "]": TokenType.RBRACKET,
-            "<": TokenType.LT,
-            ">": TokenType.GT,
-        }
-        if self._peek() in one_char_ops:
-            char = self._advance()
-            self._add_token(one_char_ops[char], char)
-            return True
-
-        return False
-
-    def _read_string(self):
-        """Read a string literal."""
-        self._advance()  # Skip opening quote
-        start = self.pos
-        while self._peek() != '"' and self._peek() != "\0":
-            if self._peek() == "\n":
-                raise LexerError("Unterminated string", self.line, self.column)
-            self._advance()
-        if self._peek() == "\0":
-            raise LexerError("Unterminated string", self.line, self.column)
-        value = self.source[start:self.pos]
-        self._advance()  # Skip closing quote
-        self._add_token(TokenType.STRING, value)
-
-    def _read_number(self):
-        """Read a number, possibly with sign and unit."""
-        start = self.pos
-        start_col = self.column
-
-        # Handle sign
-        if self._peek() in "+-":
-            self._advance()
-
-        # Read integer part
-        while self._peek().isdigit():
-            self._advance()
-
-        # Read decimal part
-        if self._peek() == "." and self._peek_ahead().isdigit():
-            self._advance()  # Skip dot
-            while self._peek().isdigit():
-                self._advance()
-
-        number_str = self.source[start:self.pos]
-        self._add_token(TokenType.NUMBER, number_str)
-
-        # Check for unit
-        unit_start = self.pos
-        # Handle degree symbol
-        if self._peek() == "°":
-            self._advance()
-            if self._peek() in "CFK":
-                self._advance()
-                self._add_token(TokenType.UNIT, self.source[unit_start:self.pos])
-                return
-
-        # Handle % and other units
-        if self._peek() == "%":
-            self._advance()
-            self._add_token(TokenType.UNIT, "%")
-            return
-
-        # Handle alphabetic units (ms, GB, etc.)
-        if self._peek().isalpha():
-            while self._peek().isalnum():
-                self._advance()
-            unit = self.source[unit_start:self.pos]
-            if unit in self.UNITS or unit.lower() in ["ms", "s", "m", "h"]:
-                self._add_token(TokenType.UNIT, unit)
-
-    def _read_identifier(self):
-        """Read an identifier or keyword."""
-        start = self.pos
-        while self._peek().isalnum() or self._peek() == "_":
-            self._advance()
-
-        value = self.source[start:self.pos]
-        lower_value = value.lower()
-
-        # Check if it's a keyword
-        if lower_value in self.KEYWORDS:
-            self._add_token(self.KEYWORDS[lower_value], value)
-        else:
-            self._add_token(TokenType.IDENTIFIER, value)
-
-    def _read_annotation(self):
-        """Read an annotation like @version or @critical."""
-        self._advance()  # Skip @
-        start = self.pos
-        while self._peek().isalnum() or self._peek() == "_":
-            self._advance()
-
-        name = self.source[start:self.pos]
-        name_lower = name.lower()
-
-        annotation_types = {
-            "version": TokenType.VERSION,
-            "critical": TokenType.CRITICAL,
-            "warning": TokenType.WARNING,
-            "priority": TokenType.PRIORITY,
-        }
-
-        if name_lower in annotation_types:
-            self._add_token(annotation_types[name_lower], name)
+# Pre-bound lookup methods save an attribute resolution per handler call
+_KW_GET = _KW_BY_LEN.get
+_ANNOT_GET = _ANNOTATION_TYPES.get
+
+
+def _handle_ident(lexer: Lexer, text: str, col: int) -> Token:
+    bucket = _KW_GET(len(text))
+    if bucket is not None:
+        if text.islower():
+            entry = bucket.get(text)
+            if entry is not None:
+                return Token(entry[1], entry[0], lexer.line, col)
         else:
-            raise LexerError(f"Unknown annotation: @{name}", self.line, self.column)
+            entry = bucket.get(text.lower())
+            if entry is not None:
+                # Case-insensitive keyword match: keep the source
+                # spelling as the value so keyword-like identifiers
+                # (a state named "Target") round-trip faithfully.
+                return Token(entry[1], sys.intern(text), lexer.line, col)
+    return Token(TokenType.IDENTIFIER, text, lexer.line, col)
+
+
+def _handle_op(lexer: Lexer, text: str, col: int) -> Token:
+    text = _OP_CANON[text]
+    return Token(_OP_TYPES[text], text, lexer.line, col)
+
+
+def _handle_annotation(lexer: Lexer, text: str, col: int) -> Token:
+    name = text[1:]
+    token_type = _ANNOT_GET(name.lower())
+    if token_type is None:
+        raise LexerError(f"Unknown annotation: @{name}", lexer.line, col)
+    return Token(token_type, sys.intern(name), lexer.line, col)
+
+
+# Dispatch on the master regex group name; handlers return the token to
+# yield, None entries are skipped text.
+_HANDLERS = {
+    "WS": None,
+    "COMMENT": None,
+    "IDENT": _handle_ident,
+    "OP": _handle_op,
+    "ANNOT": _handle_annotation,
+}
+
+
+
+
+
+
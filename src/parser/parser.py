@@ -4,7 +4,7 @@ NovaIR Parser - Parses tokens into an AST.
 This module takes the token stream from the lexer and builds an Abstract Syntax Tree.
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from .lexer import Token, TokenType
 from .ast import (
     System, State, Constraint, Objective, Action, Tick,
@@ -21,32 +21,90 @@ class ParseError(Exception):
         super().__init__(f"Line {token.line}: {message} (got {token.type.name})")
 
 
+# Time-unit multipliers for tick intervals, all normalized to ms
+_UNIT_MS = {"ms": 1, "s": 1000, "m": 60000, "h": 3600000}
+
+# Keywords that may double as identifiers in certain contexts (e.g. a
+# state named "target"); hoisted so the check doesn't rebuild a set per
+# call.
+_IDENTIFIER_LIKE = frozenset({
+    TokenType.IDENTIFIER,
+    TokenType.TARGET,
+    TokenType.MIN,
+    TokenType.MAX,
+    TokenType.MODE,
+    TokenType.INTERVAL,
+    TokenType.COST,
+})
+
+# Sentinel for exhausted token streams; the lexer normally emits its own
+# EOF token, so this only covers hand-built token iterables.
+_EOF = Token(TokenType.EOF, "", 0, 0)
+
+
 class Parser:
     """Parses NovaIR tokens into an AST."""
 
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
-        self.pos = 0
+    # Jump tables: one dict probe on the current token type replaces a
+    # chain of _match calls (each of which costs _check + _peek).
+    _CMP_OPS = {
+        TokenType.LTE: "<=",
+        TokenType.GTE: ">=",
+        TokenType.LT: "<",
+        TokenType.GT: ">",
+        TokenType.EQ: "==",
+        TokenType.NEQ: "!=",
+    }
+    _SEVERITIES = {
+        TokenType.CRITICAL: Severity.CRITICAL,
+        TokenType.WARNING: Severity.WARNING,
+    }
+    _COST_LEVELS = {
+        TokenType.LOW: CostLevel.LOW,
+        TokenType.MEDIUM: CostLevel.MEDIUM,
+        TokenType.HIGH: CostLevel.HIGH,
+    }
+    _OBJ_TYPES = {
+        TokenType.MIN: ObjectiveType.MIN,
+        TokenType.MAX: ObjectiveType.MAX,
+    }
+
+    def __init__(self, tokens: Iterable[Token]):
+        # Tokens are pulled lazily, so a generator (e.g. Lexer.tokens_iter)
+        # streams straight through without materializing the full list.
+        # The grammar is LL(1): one current-token slot is the only
+        # lookahead state needed.
+        self._tokens = iter(tokens)
+        self._cur: Token = next(self._tokens, _EOF)
+        # Repeated literals ("0 ms", "100 %") and source paths reuse one
+        # node per distinct value within a parse; nothing mutates these
+        # nodes after construction. Deliberately not a grammar-wide
+        # memoization -- only the two leaf node types worth sharing.
+        self._vwu_cache: dict = {}
+        self._path_cache: dict = {}
+        # Section keyword -> (System attribute, bound section parser)
+        self._sections = {
+            TokenType.STATE: ("states", self._parse_state_section),
+            TokenType.CONSTRAINTS: ("constraints", self._parse_constraints_section),
+            TokenType.OBJECTIVES: ("objectives", self._parse_objectives_section),
+            TokenType.ACTIONS: ("actions", self._parse_actions_section),
+            TokenType.TICK: ("tick", self._parse_tick_section),
+        }
 
     def parse(self) -> System:
         """Parse the token stream and return a System AST."""
         system = self._parse_system_decl()
 
+        sections = self._sections
         while not self._is_at_end():
             self._skip_newlines()
             if self._is_at_end():
                 break
 
-            if self._check(TokenType.STATE):
-                system.states = self._parse_state_section()
-            elif self._check(TokenType.CONSTRAINTS):
-                system.constraints = self._parse_constraints_section()
-            elif self._check(TokenType.OBJECTIVES):
-                system.objectives = self._parse_objectives_section()
-            elif self._check(TokenType.ACTIONS):
-                system.actions = self._parse_actions_section()
-            elif self._check(TokenType.TICK):
-                system.tick = self._parse_tick_section()
+            entry = sections.get(self._cur.type)
+            if entry is not None:
+                attr, parse_section = entry
+                setattr(system, attr, parse_section())
             else:
                 # Skip unknown tokens
                 self._advance()
@@ -59,27 +117,24 @@ class Parser:
 
     def _peek(self) -> Token:
         """Return current token without advancing."""
-        return self.tokens[self.pos]
-
-    def _previous(self) -> Token:
-        """Return the previous token."""
-        return self.tokens[self.pos - 1]
+        return self._cur
 
     def _is_at_end(self) -> bool:
         """Check if we've reached the end of tokens."""
-        return self._peek().type == TokenType.EOF
+        return self._cur.type == TokenType.EOF
 
     def _check(self, type: TokenType) -> bool:
         """Check if current token is of given type."""
-        if self._is_at_end():
-            return False
+        # EOF is its own token type, so one peek suffices; no separate
+        # end-of-stream probe needed.
         return self._peek().type == type
 
     def _advance(self) -> Token:
-        """Consume and return current token."""
-        if not self._is_at_end():
-            self.pos += 1
-        return self._previous()
+        """Consume and return current token (EOF is never consumed)."""
+        cur = self._cur
+        if cur.type != TokenType.EOF:
+            self._cur = next(self._tokens, _EOF)
+        return cur
 
     def _match(self, *types: TokenType) -> bool:
         """If current token matches any of the types, advance and return True."""
@@ -156,17 +211,7 @@ class Parser:
 
     def _is_identifier_like(self) -> bool:
         """Check if current token can be used as an identifier (including some keywords)."""
-        # Allow some keywords to be used as identifiers in certain contexts
-        identifier_like_types = {
-            TokenType.IDENTIFIER,
-            TokenType.TARGET,  # "target" can be a state name
-            TokenType.MIN,
-            TokenType.MAX,
-            TokenType.MODE,
-            TokenType.INTERVAL,
-            TokenType.COST,
-        }
-        return self._peek().type in identifier_like_types
+        return self._cur.type in _IDENTIFIER_LIKE
 
     def _consume_identifier_like(self, message: str) -> Token:
         """Consume a token that can be used as identifier."""
@@ -189,7 +234,11 @@ class Parser:
         while self._match(TokenType.DOT):
             parts.append(self._expect(TokenType.IDENTIFIER, "Expected identifier after '.'").value)
 
-        return SourcePath(parts=parts)
+        key = tuple(parts)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._path_cache[key] = SourcePath(parts=key)
+        return path
 
     # ============================================
     # Constraints section
@@ -234,26 +283,19 @@ class Parser:
 
     def _parse_comparison_operator(self) -> str:
         """Parse a comparison operator."""
-        ops = {
-            TokenType.LTE: "<=",
-            TokenType.GTE: ">=",
-            TokenType.LT: "<",
-            TokenType.GT: ">",
-            TokenType.EQ: "==",
-            TokenType.NEQ: "!=",
-        }
-        for token_type, op_str in ops.items():
-            if self._match(token_type):
-                return op_str
-        raise ParseError("Expected comparison operator", self._peek())
+        op = self._CMP_OPS.get(self._peek().type)
+        if op is None:
+            raise ParseError("Expected comparison operator", self._peek())
+        self._advance()
+        return op
 
     def _parse_severity(self) -> Severity:
         """Parse @critical or @warning."""
-        if self._match(TokenType.CRITICAL):
-            return Severity.CRITICAL
-        elif self._match(TokenType.WARNING):
-            return Severity.WARNING
-        raise ParseError("Expected @critical or @warning", self._peek())
+        severity = self._SEVERITIES.get(self._peek().type)
+        if severity is None:
+            raise ParseError("Expected @critical or @warning", self._peek())
+        self._advance()
+        return severity
 
     # ============================================
     # Objectives section
@@ -304,11 +346,11 @@ class Parser:
             value = self._parse_value_with_unit()
             self._expect(TokenType.RPAREN, "Expected ')' after target value")
             return (ObjectiveType.TARGET, value)
-        elif self._match(TokenType.MIN):
-            return (ObjectiveType.MIN, None)
-        elif self._match(TokenType.MAX):
-            return (ObjectiveType.MAX, None)
-        raise ParseError("Expected 'target', 'min', or 'max'", self._peek())
+        obj_type = self._OBJ_TYPES.get(self._peek().type)
+        if obj_type is None:
+            raise ParseError("Expected 'target', 'min', or 'max'", self._peek())
+        self._advance()
+        return (obj_type, None)
 
     def _parse_priority(self) -> int:
         """Parse @priority(n)."""
@@ -316,7 +358,7 @@ class Parser:
         self._expect(TokenType.LPAREN, "Expected '(' after @priority")
         num_token = self._expect(TokenType.NUMBER, "Expected priority number")
         self._expect(TokenType.RPAREN, "Expected ')' after priority")
-        return int(float(num_token.value))
+        return int(num_token.num_value)
 
     # ============================================
     # Actions section
@@ -388,8 +430,8 @@ class Parser:
 
             parameters.append(Parameter(
                 name=name_token.value,
-                min_value=int(float(min_token.value)),
-                max_value=int(float(max_token.value))
+                min_value=int(min_token.num_value),
+                max_value=int(max_token.num_value)
             ))
 
             if not self._match(TokenType.COMMA):
@@ -432,13 +474,11 @@ class Parser:
 
     def _parse_cost_level(self) -> CostLevel:
         """Parse low, medium, or high."""
-        if self._match(TokenType.LOW):
-            return CostLevel.LOW
-        elif self._match(TokenType.MEDIUM):
-            return CostLevel.MEDIUM
-        elif self._match(TokenType.HIGH):
-            return CostLevel.HIGH
-        raise ParseError("Expected 'low', 'medium', or 'high'", self._peek())
+        cost = self._COST_LEVELS.get(self._peek().type)
+        if cost is None:
+            raise ParseError("Expected 'low', 'medium', or 'high'", self._peek())
+        self._advance()
+        return cost
 
     # ============================================
     # Tick section
@@ -459,27 +499,22 @@ class Parser:
                     num_token = self._expect(TokenType.NUMBER, "Expected number")
                     # Unit can be UNIT token or IDENTIFIER (ms, s, m, h)
                     unit = "ms"  # default
-                    if self._match(TokenType.UNIT):
-                        unit = self._previous().value.lower()
+                    if self._check(TokenType.UNIT):
+                        unit = self._advance().value.lower()
                     elif self._check(TokenType.IDENTIFIER):
                         # Accept ms, s, m, h as identifiers too
                         id_value = self._peek().value.lower()
-                        if id_value in ("ms", "s", "m", "h"):
+                        if id_value in _UNIT_MS:
                             self._advance()
                             unit = id_value
-                    # Convert to ms
-                    value = float(num_token.value)
-                    if unit == "s":
-                        value *= 1000
-                    elif unit == "m":
-                        value *= 60000
-                    elif unit == "h":
-                        value *= 3600000
-                    tick.interval_ms = int(value)
+                    multiplier = _UNIT_MS.get(unit)
+                    if multiplier is None:
+                        raise ParseError(f"Unknown time unit: {unit}", self._peek())
+                    tick.interval_ms = int(num_token.num_value * multiplier)
                 elif self._match(TokenType.ACTION_THRESHOLD):
                     self._expect(TokenType.COLON, "Expected ':'")
                     num_token = self._expect(TokenType.NUMBER, "Expected number")
-                    tick.action_threshold = float(num_token.value)
+                    tick.action_threshold = num_token.num_value
                 elif self._match(TokenType.MODE):
                     self._expect(TokenType.COLON, "Expected ':'")
                     if self._match(TokenType.CONTINUOUS):
@@ -501,10 +536,14 @@ class Parser:
     def _parse_value_with_unit(self) -> ValueWithUnit:
         """Parse a number with optional unit."""
         num_token = self._expect(TokenType.NUMBER, "Expected number")
-        value = float(num_token.value)
+        value = num_token.num_value
         unit = None
 
-        if self._match(TokenType.UNIT):
-            unit = self._previous().value
+        if self._check(TokenType.UNIT):
+            unit = self._advance().value
 
-        return ValueWithUnit(value=value, unit=unit)
+        key = (value, unit)
+        vwu = self._vwu_cache.get(key)
+        if vwu is None:
+            vwu = self._vwu_cache[key] = ValueWithUnit(value=value, unit=unit)
+        return vwu
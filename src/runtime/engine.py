@@ -5,18 +5,21 @@ This is the heart of NovaIR: it reads state, evaluates constraints,
 scores actions, and executes the best one.
 """
 
+import copy
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any
+from typing import Deque, Dict, List, Optional, Callable, Any
 from datetime import datetime
+import queue
 import time
 import threading
 
-from ..parser.ast import System
+from ..parser.ast import System, TickMode
 from .state import StateManager
 from .scorer import Scorer, ActionCandidate, ConstraintStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineConfig:
     """Configuration for the NovaIR engine."""
     tick_interval_ms: int = 100
@@ -26,10 +29,10 @@ class EngineConfig:
     dry_run: bool = False  # If True, don't execute actions
 
 
-@dataclass
+@dataclass(slots=True)
 class TickResult:
     """Result of a single tick evaluation."""
-    timestamp: datetime
+    timestamp_ns: int
     constraints: List[ConstraintStatus]
     violations: List[ConstraintStatus]
     candidates_evaluated: int
@@ -37,6 +40,11 @@ class TickResult:
     action_executed: bool
     execution_time_ms: float
 
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time of the tick, built lazily from the raw stamp."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
     def __repr__(self) -> str:
         action_str = str(self.selected_action) if self.selected_action else "None"
         return (f"Tick @ {self.timestamp.strftime('%H:%M:%S.%f')[:-3]}: "
@@ -54,7 +62,7 @@ class Engine:
         if system.tick:
             self.config.tick_interval_ms = system.tick.interval_ms
             self.config.action_threshold = system.tick.action_threshold
-            self.config.continuous_mode = system.tick.mode.value == "continuous"
+            self.config.continuous_mode = system.tick.mode == TickMode.CONTINUOUS
 
         # State manager
         self.state = StateManager()
@@ -68,26 +76,55 @@ class Engine:
 
         # Callbacks
         self._state_readers: Dict[str, Callable[[], float]] = {}
+        self._trusted_readers: List[Any] = []
+        self._batch_readers: List[Any] = []
+        # (name, reader) pairs for declared states with a registered
+        # reader, rebuilt on registration so read_states doesn't redo
+        # the membership tests every tick.
+        self._reader_plan: List[Any] = []
         self._action_handlers: Dict[str, Callable[[Dict[str, int]], None]] = {}
         self._tick_callbacks: List[Callable[[TickResult], None]] = []
+        self._async_callbacks: List[Callable[[TickResult], None]] = []
+        self._cb_queue: Optional[queue.SimpleQueue] = None
 
         # Runtime state
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._tick_count = 0
-        self._history: List[TickResult] = []
+        self._history: Deque[TickResult] = deque(maxlen=1000)
+
+        # Tick body specialized once with loop invariants bound as
+        # locals; every captured object is stable for the engine's
+        # lifetime, so no rebuild hooks are needed.
+        self._do_tick = self._compile_tick()
 
     # ==========================================
     # Configuration
     # ==========================================
 
-    def register_state_reader(self, name: str, reader: Callable[[], float]) -> None:
+    def register_state_reader(self, name: str, reader: Callable[[], float],
+                              trusted: bool = False) -> None:
         """Register a function that reads a state value.
 
+        Trusted readers are invoked without a per-reader try/except on
+        the tick path; if one raises, the remaining trusted reads are
+        skipped for that tick. Use for readers that cannot fail (e.g.
+        simulation lookups).
+
         Example:
             engine.register_state_reader("temperature", lambda: sensor.read_temp())
         """
-        self._state_readers[name] = reader
+        if trusted:
+            self._trusted_readers.append((name, reader))
+        else:
+            self._state_readers[name] = reader
+            self._rebuild_reader_plan()
+
+    def _rebuild_reader_plan(self) -> None:
+        """Recompute the per-tick read plan from declared states."""
+        readers = self._state_readers
+        self._reader_plan = [(s.name, readers[s.name])
+                             for s in self.system.states if s.name in readers]
 
     def register_action_handler(self, name: str,
                                 handler: Callable[[Dict[str, int]], None]) -> None:
@@ -99,9 +136,48 @@ class Engine:
         """
         self._action_handlers[name] = handler
 
-    def on_tick(self, callback: Callable[[TickResult], None]) -> None:
-        """Register a callback to be called after each tick."""
-        self._tick_callbacks.append(callback)
+    def register_state_reader_batch(self, names: List[str],
+                                    reader: Callable[[], Dict[str, float]]) -> None:
+        """Register one function that reads several states at once.
+
+        Useful when the underlying connector can fetch all sensors in a
+        single call (one syscall/IPC round-trip instead of one per state).
+
+        Example:
+            engine.register_state_reader_batch(
+                ["temperature", "fan_speed"], sim.read_all)
+        """
+        self._batch_readers.append((tuple(names), reader))
+
+    def on_tick(self, callback: Callable[[TickResult], None],
+                synchronous: bool = True) -> None:
+        """Register a callback to be called after each tick.
+
+        Synchronous callbacks run inside tick() and count toward
+        execution_time_ms; pass synchronous=False to have the callback
+        drained by a background thread so slow observers (exporters,
+        loggers) don't throttle the tick rate. Asynchronous callbacks
+        may still be in flight when the process exits.
+        """
+        if synchronous:
+            self._tick_callbacks.append(callback)
+            return
+        self._async_callbacks.append(callback)
+        if self._cb_queue is None:
+            self._cb_queue = queue.SimpleQueue()
+            drain = threading.Thread(target=self._drain_callbacks, daemon=True)
+            drain.start()
+
+    def _drain_callbacks(self) -> None:
+        """Deliver tick results to asynchronous callbacks off-thread."""
+        q = self._cb_queue
+        while True:
+            result = q.get()
+            for callback in self._async_callbacks:
+                try:
+                    callback(result)
+                except Exception as e:
+                    print(f"Warning: Tick callback failed: {e}")
 
     def set_state(self, name: str, value: float) -> None:
         """Manually set a state value (for testing or simulation)."""
@@ -118,11 +194,28 @@ class Engine:
     def read_states(self) -> Dict[str, float]:
         """Read all states from registered readers."""
         values = {}
-        for state_def in self.system.states:
-            name = state_def.name
-            if name in self._state_readers:
+        for names, reader in self._batch_readers:
+            try:
+                batch = reader()
+            except Exception as e:
+                print(f"Warning: Failed to read states {list(names)}: {e}")
+                continue
+            for name in names:
+                if name in batch:
+                    values[name] = batch[name]
+        name = None
+        try:
+            # One exception frame for the whole trusted loop instead of
+            # one per reader.
+            for name, reader in self._trusted_readers:
+                if name not in values:
+                    values[name] = reader()
+        except Exception as e:
+            print(f"Warning: Failed to read state '{name}': {e}")
+        for name, reader in self._reader_plan:
+            if name not in values:
                 try:
-                    values[name] = self._state_readers[name]()
+                    values[name] = reader()
                 except Exception as e:
                     print(f"Warning: Failed to read state '{name}': {e}")
         self.state.update_all(values)
@@ -143,57 +236,75 @@ class Engine:
                 return False
         return False
 
+    def _compile_tick(self) -> Callable[[], TickResult]:
+        """Build the tick closure with per-tick invariants pre-bound."""
+        scorer = self.scorer
+        state = self.state
+        config = self.config
+        history = self._history
+        callbacks = self._tick_callbacks
+        read_states = self.read_states
+        execute_action = self.execute_action
+        perf_counter = time.perf_counter
+        time_ns = time.time_ns
+
+        def _do_tick() -> TickResult:
+            start_time = perf_counter()
+            self._tick_count += 1
+
+            # 1. Read current state
+            read_states()
+            state.snapshot()
+
+            # 2. Check constraints. The scorer pools these status
+            # objects and rewrites them on the next state change, so
+            # snapshot them before they go into a retained TickResult
+            # (shallow copies share the static Constraint nodes).
+            constraints = [copy.copy(c) for c in scorer.check_constraints()[0]]
+            violations = [c for c in constraints if c.is_violated]
+
+            # 3-4. Select best action; selection generates and scores
+            # every candidate in one fused batch pass.
+            candidates = scorer.generate_candidates()
+            selected = scorer.select_best_action(config.action_threshold)
+
+            # 5. Execute if threshold met
+            executed = False
+            if selected:
+                executed = execute_action(selected)
+
+            # Create result
+            execution_time = (perf_counter() - start_time) * 1000
+            result = TickResult(
+                timestamp_ns=time_ns(),
+                constraints=constraints,
+                violations=violations,
+                candidates_evaluated=len(candidates),
+                selected_action=selected,
+                action_executed=executed,
+                execution_time_ms=execution_time
+            )
+
+            # Store history; the deque drops the oldest entry in place
+            history.append(result)
+
+            # Call tick callbacks; async observers just get a queue put
+            for callback in callbacks:
+                try:
+                    callback(result)
+                except Exception as e:
+                    print(f"Warning: Tick callback failed: {e}")
+            q = self._cb_queue
+            if q is not None:
+                q.put(result)
+
+            return result
+
+        return _do_tick
+
     def tick(self) -> TickResult:
         """Execute one tick of the engine."""
-        start_time = time.time()
-        self._tick_count += 1
-
-        # 1. Read current state
-        self.read_states()
-        self.state.snapshot()
-
-        # 2. Check constraints
-        constraints = self.scorer.check_constraints()
-        violations = [c for c in constraints if c.is_violated]
-
-        # 3. Generate and score candidates
-        candidates = self.scorer.generate_candidates()
-        for candidate in candidates:
-            self.scorer.score_candidate(candidate, violations)
-
-        # 4. Select best action
-        selected = self.scorer.select_best_action(self.config.action_threshold)
-
-        # 5. Execute if threshold met
-        executed = False
-        if selected:
-            executed = self.execute_action(selected)
-
-        # Create result
-        execution_time = (time.time() - start_time) * 1000
-        result = TickResult(
-            timestamp=datetime.now(),
-            constraints=constraints,
-            violations=violations,
-            candidates_evaluated=len(candidates),
-            selected_action=selected,
-            action_executed=executed,
-            execution_time_ms=execution_time
-        )
-
-        # Store history
-        self._history.append(result)
-        if len(self._history) > 1000:
-            self._history = self._history[-500:]
-
-        # Call tick callbacks
-        for callback in self._tick_callbacks:
-            try:
-                callback(result)
-            except Exception as e:
-                print(f"Warning: Tick callback failed: {e}")
-
-        return result
+        return self._do_tick()
 
     def run(self, duration_seconds: Optional[float] = None) -> None:
         """Run the engine in the current thread.
@@ -202,15 +313,49 @@ class Engine:
             duration_seconds: How long to run (None = forever until stop())
         """
         self._running = True
-        start_time = time.time()
+        start_time = time.monotonic()
+        interval = self.config.tick_interval_ms / 1000.0
+        # Schedule against monotonic deadlines so tick duration doesn't
+        # accumulate as drift in the effective rate.
+        next_deadline = start_time + interval
 
         while self._running:
             self.tick()
 
-            if duration_seconds and (time.time() - start_time) >= duration_seconds:
+            if duration_seconds and (time.monotonic() - start_time) >= duration_seconds:
                 break
 
-            time.sleep(self.config.tick_interval_ms / 1000.0)
+            sleep_for = next_deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+                next_deadline += interval
+            else:
+                # Behind schedule: resync rather than burst to catch up
+                next_deadline = time.monotonic() + interval
+
+    def run_batched(self, ticks: int, batch: int = 4) -> List[TickResult]:
+        """Run a fixed number of ticks, sleeping once per batch.
+
+        Ticks inside a batch run back-to-back and the sleep for the whole
+        batch is issued as a single call, amortizing the per-iteration
+        syscall overhead. Total wall-clock pacing matches `ticks` at the
+        configured interval.
+        """
+        results: List[TickResult] = []
+        interval = self.config.tick_interval_ms / 1000.0
+        self._running = True
+
+        remaining = ticks
+        while remaining > 0 and self._running:
+            n = batch if batch < remaining else remaining
+            for _ in range(n):
+                results.append(self.tick())
+            remaining -= n
+            if remaining > 0:
+                time.sleep(n * interval)
+
+        self._running = False
+        return results
 
     def start(self) -> None:
         """Start the engine in a background thread."""
@@ -232,10 +377,14 @@ class Engine:
     # Inspection
     # ==========================================
 
+    @property
+    def tick_count(self) -> int:
+        """Number of ticks executed so far."""
+        return self._tick_count
+
     def get_status(self) -> Dict[str, Any]:
         """Get current engine status."""
-        constraints = self.scorer.check_constraints()
-        violations = [c for c in constraints if c.is_violated]
+        constraints, violations = self.scorer.check_constraints()
 
         return {
             "running": self._running,
@@ -6,15 +6,126 @@ which action to take based on constraints and objectives.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
 from ..parser.ast import (
     System, Constraint, Objective, Action, Effect,
-    Severity, ObjectiveType, CostLevel
+    Severity, ObjectiveType, CostLevel, OP_CODES
 )
 from .state import StateManager
 
+# Try to import numba for JIT-compiled scoring kernels
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+# Margin per operator, keyed by OP_CODES; negative margin = violated.
+# A dict of small lambdas replaces the string if/elif chain so both the
+# scalar path and code that already holds op codes dispatch in one hash
+# lookup.
+_OP_TABLE: Dict[int, Callable[[float, float], float]] = {
+    0: lambda current, threshold: threshold - current,            # <=
+    1: lambda current, threshold: current - threshold,            # >=
+    2: lambda current, threshold: threshold - current - 0.001,    # <
+    3: lambda current, threshold: current - threshold - 0.001,    # >
+    4: lambda current, threshold: -abs(current - threshold),      # ==
+    5: lambda current, threshold: abs(current - threshold) - 0.001,  # !=
+}
+
+
+def _margins(current: np.ndarray, op: np.ndarray,
+             threshold: np.ndarray) -> np.ndarray:
+    """Margins for every constraint at once, branch-free via np.select."""
+    return np.select(
+        [op == 0, op == 1, op == 2, op == 3, op == 4],
+        [threshold - current,
+         current - threshold,
+         threshold - current - 0.001,
+         current - threshold - 0.001,
+         -np.abs(current - threshold)],
+        np.abs(current - threshold) - 0.001)
+
+
+def _resolution_scores(ev: np.ndarray, v_op: np.ndarray, v_thr: np.ndarray,
+                       v_cur: np.ndarray) -> np.ndarray:
+    """Constraint-resolution term for each candidate (NumPy fallback).
+
+    `ev` is (candidates x violations) predicted effects on the violated
+    metrics; op codes follow OP_CODES.
+    """
+    decrease = (v_op == 0) | (v_op == 2)   # <= and <
+    increase = (v_op == 1) | (v_op == 3)   # >= and >
+    helps = np.where(decrease & (ev < 0),
+                     np.minimum(-ev, v_cur - v_thr), 0.0)
+    helps += np.where(increase & (ev > 0),
+                      np.minimum(ev, v_thr - v_cur), 0.0)
+    return 2.0 * helps.sum(axis=1)
+
+
+def _objective_scores(eo: np.ndarray, obj_type: np.ndarray, weight: np.ndarray,
+                      target: np.ndarray, cur_o: np.ndarray) -> np.ndarray:
+    """Objective term for each candidate (NumPy fallback).
+
+    `eo` is (candidates x objectives) predicted effects on the objective
+    metrics; type codes follow ObjectiveType.
+    """
+    min_score = np.where(eo < 0, -eo * weight, -eo * weight * 0.5)
+    max_score = np.where(eo > 0, eo * weight, eo * weight * 0.5)
+    improvement = np.abs(cur_o - target) - np.abs(cur_o + eo - target)
+    target_score = improvement * weight * np.where(improvement > 0, 1.0, 0.5)
+    per_objective = np.select(
+        [obj_type == int(ObjectiveType.MIN),
+         obj_type == int(ObjectiveType.MAX)],
+        [min_score, max_score], target_score)
+    return per_objective.sum(axis=1)
+
+
+if _NUMBA_AVAILABLE:
+    # Same math as the fallbacks above, but as fused loops: for the
+    # small candidate sets NovaIR generates, the NumPy versions spend
+    # most of their time allocating temporaries.
+    @njit(cache=True)
+    def _resolution_scores(ev, v_op, v_thr, v_cur):  # noqa: F811
+        n, k = ev.shape
+        out = np.zeros(n)
+        for i in range(n):
+            acc = 0.0
+            for j in range(k):
+                e = ev[i, j]
+                op = v_op[j]
+                if (op == 0 or op == 2) and e < 0.0:
+                    acc += min(-e, v_cur[j] - v_thr[j])
+                elif (op == 1 or op == 3) and e > 0.0:
+                    acc += min(e, v_thr[j] - v_cur[j])
+            out[i] = 2.0 * acc
+        return out
+
+    @njit(cache=True)
+    def _objective_scores(eo, obj_type, weight, target, cur_o):  # noqa: F811
+        n, k = eo.shape
+        out = np.zeros(n)
+        for i in range(n):
+            acc = 0.0
+            for j in range(k):
+                e = eo[i, j]
+                w = weight[j]
+                t = obj_type[j]
+                if t == 2:    # ObjectiveType.MIN
+                    acc += -e * w if e < 0.0 else -e * w * 0.5
+                elif t == 3:  # ObjectiveType.MAX
+                    acc += e * w if e > 0.0 else e * w * 0.5
+                else:         # ObjectiveType.TARGET
+                    imp = abs(cur_o[j] - target[j]) - abs(cur_o[j] + e - target[j])
+                    acc += imp * w if imp > 0.0 else imp * w * 0.5
+            out[i] = acc
+        return out
+
 
 class ViolationType(Enum):
     """Type of constraint violation."""
@@ -23,7 +134,7 @@ class ViolationType(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintStatus:
     """Status of a constraint evaluation."""
     constraint: Constraint
@@ -41,7 +152,7 @@ class ConstraintStatus:
         return f"{self.constraint.name}: {self.current_value:.1f} {self.constraint.operator} {self.threshold:.1f} [{status}]"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionCandidate:
     """A candidate action with its parameters and score."""
     action: Action
@@ -70,60 +181,183 @@ class Scorer:
     def __init__(self, system: System, state_manager: StateManager):
         self.system = system
         self.state = state_manager
+        # Structure-of-arrays views of the static parts of the system:
+        # the per-candidate scoring loop reads these instead of chasing
+        # AST attributes.
+        self._view = system.compile_view()
+
+        # Column space for the batch kernels: declared states first,
+        # then any constraint/objective metrics that are not declared
+        # states, so nothing fancy-indexes a wrong column and scoring
+        # on undeclared metrics matches the scalar path (they read as
+        # 0.0 until a reader supplies them).
+        self._batch_index = dict(self._view.state_index)
+        for node in (*system.constraints, *system.objectives):
+            if node.metric not in self._batch_index:
+                self._batch_index[node.metric] = len(self._batch_index)
+        self._batch_names = list(self._batch_index)
+
+        objectives = system.objectives
+        self._obj_idx = np.array(
+            [self._batch_index[o.metric] for o in objectives],
+            dtype=np.int32)
+        self._obj_type = np.array([int(o.type) for o in objectives], dtype=np.int8)
+        self._obj_weight = np.array([o.priority / 10.0 for o in objectives])
+        self._obj_target = np.array(
+            [o.target_value.value
+             if o.type == ObjectiveType.TARGET and o.target_value else 0.0
+             for o in objectives])
+        self._total_priority = sum(o.priority for o in objectives)
+        # Same constants as scalar rows for the single-candidate path
+        self._obj_rows = [
+            (o.metric, o.type, o.priority / 10.0,
+             o.target_value.value
+             if o.type == ObjectiveType.TARGET and o.target_value else 0.0)
+            for o in objectives]
+
+        # Resolve every system metric to a dense state-manager slot up
+        # front: per-tick reads below go through integer ids and the
+        # manager's value array, with names kept for display. Unknown
+        # constraint metrics get fresh slots that simply stay 0.0.
+        self._slot = np.array(
+            [state_manager.register_metric(name)
+             for name in self._batch_names], dtype=np.intp)
+        self._con_slot = np.array(
+            [state_manager.register_metric(c.metric)
+             for c in system.constraints], dtype=np.intp)
+
+        # Per-action prediction plans: parameter defs by name, and each
+        # effect unpacked to (metric, min, max, has_range) scalars so
+        # predict_effects stops scanning parameter lists and chasing
+        # ValueWithUnit nodes per candidate.
+        self._param_map: Dict[int, Dict[str, "Parameter"]] = {}
+        self._effect_rows: Dict[int, List[Tuple[str, float, float, bool]]] = {}
+        for action in system.actions:
+            self._param_map[id(action)] = {p.name: p for p in action.parameters}
+            self._effect_rows[id(action)] = [
+                (e.metric, e.min_effect.value,
+                 e.max_effect.value if e.max_effect else e.min_effect.value,
+                 e.max_effect is not None)
+                for e in action.effects]
+
+        # Candidate parameter grids are static per action: build the
+        # combination dicts once and share them across ticks (consumers
+        # only read them).
+        self._param_grids: Dict[int, List[Dict[str, int]]] = {
+            id(a): self._generate_parameter_combinations(a)
+            for a in system.actions if a.parameters}
+
+        # Dense effect columns per action for the fused batch path:
+        # (column, base, span), span 0 for fixed effects. Effects on
+        # metrics outside the batch column space are display-only and
+        # excluded here; they influence no constraint or objective.
+        self._effect_cols: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for action in system.actions:
+            rows = self._effect_rows[id(action)]
+            idx = np.array(
+                [self._batch_index.get(r[0], -1) for r in rows],
+                dtype=np.intp)
+            base = np.array([r[1] for r in rows])
+            span = np.array([r[2] - r[1] if r[3] else 0.0 for r in rows])
+            keep = idx >= 0
+            self._effect_cols[id(action)] = (idx[keep], base[keep], span[keep])
+
+        # Which metrics each action touches, as a bitmask over state
+        # slots: lets selection skip candidates that cannot possibly
+        # resolve the current violations before scoring them.
+        n_columns = len(self._batch_index)
+        self._action_index = {id(a): i for i, a in enumerate(system.actions)}
+        self._action_metric_mask = np.zeros(
+            (len(system.actions), n_columns), dtype=bool)
+        for i, action in enumerate(system.actions):
+            for effect in action.effects:
+                j = self._batch_index.get(effect.metric)
+                if j is not None:
+                    self._action_metric_mask[i, j] = True
+
+        # Static per-constraint fields, unpacked once from the compiled
+        # view so the per-tick constraint loop touches no AST nodes.
+        is_critical = self._view.constraint_severity == int(Severity.CRITICAL)
+        self._con_rows = list(zip(
+            system.constraints,
+            self._view.constraint_threshold.tolist(),
+            is_critical.tolist()))
+
+        # Preallocated status objects, one per constraint, mutated in
+        # place on each evaluation instead of reallocated per tick.
+        self._status_pool = [
+            ConstraintStatus(constraint=constraint, current_value=0.0,
+                             threshold=threshold,
+                             violation=ViolationType.NONE, margin=0.0)
+            for constraint, threshold, _ in self._con_rows]
+
+        # (state version, results, violations) of the last evaluation;
+        # constraints are static after parse, so results only change
+        # when state does.
+        self._constraint_cache: Optional[Tuple[int, List[ConstraintStatus],
+                                               List[ConstraintStatus]]] = None
+
+    def check_constraints(self) -> Tuple[List[ConstraintStatus],
+                                         List[ConstraintStatus]]:
+        """Check all constraints against current state.
+
+        Returns (all statuses, violated statuses), both filled in one
+        pass so callers don't re-filter per tick. Results are cached
+        per state version: callers hitting this several times within
+        one tick (scoring, status, explain) share one evaluation.
+
+        The status objects are pooled and updated in place when state
+        changes, so callers must not retain them across ticks.
+        """
+        cached = self._constraint_cache
+        version = self.state.version
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
 
-    def check_constraints(self) -> List[ConstraintStatus]:
-        """Check all constraints against current state."""
-        results = []
+        results = self._status_pool
+        violated = []
+        rows = self._con_rows
 
-        for constraint in self.system.constraints:
-            current = self.state.get(constraint.metric)
-            threshold = constraint.value.value
+        # All margins in one branch-free pass: current values gathered
+        # by slot id from the state manager's dense array
+        current_arr = self.state.dense_values()[self._con_slot]
+        margin_arr = _margins(current_arr, self._view.constraint_op,
+                              self._view.constraint_threshold)
 
-            # Evaluate constraint
-            margin = self._evaluate_constraint(current, constraint.operator, threshold)
+        for i, (constraint, threshold, is_critical) in enumerate(rows):
+            margin = float(margin_arr[i])
 
             if margin < 0:
-                violation = (ViolationType.CRITICAL
-                             if constraint.severity == Severity.CRITICAL
+                violation = (ViolationType.CRITICAL if is_critical
                              else ViolationType.WARNING)
             else:
                 violation = ViolationType.NONE
 
-            results.append(ConstraintStatus(
-                constraint=constraint,
-                current_value=current,
-                threshold=threshold,
-                violation=violation,
-                margin=margin
-            ))
+            status = results[i]
+            status.current_value = float(current_arr[i])
+            status.violation = violation
+            status.margin = margin
+            if violation != ViolationType.NONE:
+                violated.append(status)
 
-        return results
+        self._constraint_cache = (version, results, violated)
+        return results, violated
 
     def _evaluate_constraint(self, current: float, operator: str, threshold: float) -> float:
         """Evaluate a constraint and return margin (negative = violated)."""
-        if operator == "<=":
-            return threshold - current
-        elif operator == ">=":
-            return current - threshold
-        elif operator == "<":
-            return threshold - current - 0.001
-        elif operator == ">":
-            return current - threshold - 0.001
-        elif operator == "==":
-            return -abs(current - threshold)
-        elif operator == "!=":
-            return abs(current - threshold) - 0.001
-        return 0.0
+        margin_of = _OP_TABLE.get(OP_CODES.get(operator, -1))
+        if margin_of is None:
+            return 0.0
+        return margin_of(current, threshold)
 
     def get_critical_violations(self) -> List[ConstraintStatus]:
         """Get list of critical constraint violations."""
-        return [c for c in self.check_constraints()
+        return [c for c in self.check_constraints()[1]
                 if c.violation == ViolationType.CRITICAL]
 
     def get_all_violations(self) -> List[ConstraintStatus]:
         """Get list of all constraint violations (critical and warning)."""
-        return [c for c in self.check_constraints()
-                if c.violation != ViolationType.NONE]
+        return self.check_constraints()[1]
 
     def generate_candidates(self) -> List[ActionCandidate]:
         """Generate all possible action candidates with parameter variations."""
@@ -131,9 +365,8 @@ class Scorer:
 
         for action in self.system.actions:
             if action.parameters:
-                # Generate candidates for each parameter combination
-                param_values = self._generate_parameter_combinations(action)
-                for params in param_values:
+                # One candidate per precomputed parameter combination
+                for params in self._param_grids[id(action)]:
                     candidates.append(ActionCandidate(
                         action=action,
                         parameters=params
@@ -170,32 +403,22 @@ class Scorer:
     def predict_effects(self, candidate: ActionCandidate) -> Dict[str, float]:
         """Predict the effects of an action on state values."""
         effects = {}
-
-        for effect in candidate.action.effects:
-            # Calculate effect magnitude based on parameters
-            if effect.max_effect:
-                # Range effect: interpolate based on parameter
-                min_eff = effect.min_effect.value
-                max_eff = effect.max_effect.value
-
-                # Use first parameter to interpolate (simplified)
-                if candidate.parameters:
-                    param_name = list(candidate.parameters.keys())[0]
-                    param_value = candidate.parameters[param_name]
-                    param_def = next((p for p in candidate.action.parameters
-                                      if p.name == param_name), None)
-                    if param_def:
-                        ratio = ((param_value - param_def.min_value) /
-                                 (param_def.max_value - param_def.min_value))
-                        effect_value = min_eff + (max_eff - min_eff) * ratio
-                    else:
-                        effect_value = (min_eff + max_eff) / 2
-                else:
-                    effect_value = (min_eff + max_eff) / 2
-            else:
-                effect_value = effect.min_effect.value
-
-            effects[effect.metric] = effect_value
+        action_id = id(candidate.action)
+
+        # Interpolation ratio from the first parameter (simplified);
+        # 0.5 reproduces the midpoint used when no parameter applies.
+        ratio = 0.5
+        parameters = candidate.parameters
+        if parameters:
+            param_name = next(iter(parameters))
+            param_def = self._param_map[action_id].get(param_name)
+            if param_def is not None:
+                ratio = ((parameters[param_name] - param_def.min_value) /
+                         (param_def.max_value - param_def.min_value))
+
+        for metric, min_eff, max_eff, has_range in self._effect_rows[action_id]:
+            effects[metric] = (min_eff + (max_eff - min_eff) * ratio
+                               if has_range else min_eff)
 
         candidate.predicted_effects = effects
         return effects
@@ -206,12 +429,18 @@ class Scorer:
         # Predict effects
         self.predict_effects(candidate)
 
+        # One state snapshot for the whole candidate: the scoring
+        # helpers read plain dict entries instead of going through
+        # state.get per constraint/objective.
+        current_values = self.state.current
+
         # 1. Constraint resolution score (highest priority)
-        constraint_score = self._score_constraint_resolution(candidate, violations)
+        constraint_score = self._score_constraint_resolution(
+            candidate, violations, current_values)
         candidate.constraint_resolution_score = constraint_score
 
         # 2. Objective optimization score
-        objective_score = self._score_objectives(candidate)
+        objective_score = self._score_objectives(candidate, current_values)
         candidate.objective_score = objective_score
 
         # 3. Cost penalty
@@ -231,7 +460,8 @@ class Scorer:
         return total
 
     def _score_constraint_resolution(self, candidate: ActionCandidate,
-                                     violations: List[ConstraintStatus]) -> float:
+                                     violations: List[ConstraintStatus],
+                                     current_values: Dict[str, float]) -> float:
         """Score how well this action resolves constraint violations."""
         if not violations:
             return 0.0
@@ -242,7 +472,7 @@ class Scorer:
             metric = violation.constraint.metric
             if metric in candidate.predicted_effects:
                 effect = candidate.predicted_effects[metric]
-                current = self.state.get(metric)
+                current = violation.current_value
                 threshold = violation.threshold
                 operator = violation.constraint.operator
 
@@ -260,38 +490,35 @@ class Scorer:
 
         return resolution_score
 
-    def _score_objectives(self, candidate: ActionCandidate) -> float:
+    def _score_objectives(self, candidate: ActionCandidate,
+                          current_values: Dict[str, float]) -> float:
         """Score how well this action optimizes objectives."""
-        total_score = 0.0
-        total_priority = sum(o.priority for o in self.system.objectives)
-
-        if total_priority == 0:
+        if self._total_priority == 0:
             return 0.0
 
-        for objective in self.system.objectives:
-            metric = objective.metric
-            priority_weight = objective.priority / 10.0  # Normalize to 0-1
+        total_score = 0.0
+        predicted = candidate.predicted_effects
 
-            if metric in candidate.predicted_effects:
-                effect = candidate.predicted_effects[metric]
-                current = self.state.get(metric)
+        for metric, obj_type, priority_weight, target in self._obj_rows:
+            if metric in predicted:
+                effect = predicted[metric]
+                current = current_values.get(metric, 0.0)
 
-                if objective.type == ObjectiveType.MIN:
+                if obj_type == ObjectiveType.MIN:
                     # Lower is better
                     if effect < 0:
                         total_score += abs(effect) * priority_weight
                     else:
                         total_score -= effect * priority_weight * 0.5
 
-                elif objective.type == ObjectiveType.MAX:
+                elif obj_type == ObjectiveType.MAX:
                     # Higher is better
                     if effect > 0:
                         total_score += effect * priority_weight
                     else:
                         total_score -= abs(effect) * priority_weight * 0.5
 
-                elif objective.type == ObjectiveType.TARGET:
-                    target = objective.target_value.value
+                elif obj_type == ObjectiveType.TARGET:
                     new_value = current + effect
                     old_distance = abs(current - target)
                     new_distance = abs(new_value - target)
@@ -307,6 +534,79 @@ class Scorer:
 
         return total_score
 
+    def _effects_matrix(self, candidates: List[ActionCandidate]) -> np.ndarray:
+        """Predicted effects of every candidate as a dense (candidates x
+        metrics) matrix, built straight from the per-action effect
+        columns without materializing per-candidate dicts.
+        """
+        effects = np.zeros((len(candidates), len(self._batch_index)))
+        param_map = self._param_map
+        effect_cols = self._effect_cols
+        for i, candidate in enumerate(candidates):
+            action_id = id(candidate.action)
+            ratio = 0.5
+            parameters = candidate.parameters
+            if parameters:
+                param_name = next(iter(parameters))
+                param_def = param_map[action_id].get(param_name)
+                if param_def is not None:
+                    ratio = ((parameters[param_name] - param_def.min_value) /
+                             (param_def.max_value - param_def.min_value))
+            idx, base, span = effect_cols[action_id]
+            effects[i, idx] = base + span * ratio
+        return effects
+
+    def _score_batch(self, candidates: List[ActionCandidate],
+                     violations: List[ConstraintStatus]) -> None:
+        """Score every candidate in one vectorized pass.
+
+        Semantically identical to calling score_candidate per candidate,
+        but effect prediction and the constraint x candidate and
+        objective x candidate loops are fused into NumPy array
+        operations; no per-candidate effect dicts are built.
+        """
+        view = self._view
+        batch_index = self._batch_index
+        n = len(candidates)
+        effects = self._effects_matrix(candidates)
+
+        if violations:
+            count = len(violations)
+            v_idx = np.fromiter(
+                (batch_index[v.constraint.metric] for v in violations),
+                np.int64, count)
+            v_op = np.fromiter(
+                (OP_CODES[v.constraint.operator] for v in violations),
+                np.int8, count)
+            v_thr = np.fromiter((v.threshold for v in violations), float, count)
+            v_cur = np.fromiter((v.current_value for v in violations), float, count)
+
+            resolution = _resolution_scores(effects[:, v_idx], v_op, v_thr, v_cur)
+        else:
+            resolution = np.zeros(n)
+
+        if self._obj_idx.size and self._total_priority:
+            current = self.state.dense_values()[self._slot]
+            objective = _objective_scores(
+                effects[:, self._obj_idx], self._obj_type, self._obj_weight,
+                self._obj_target, current[self._obj_idx])
+        else:
+            objective = np.zeros(n)
+
+        cost = np.fromiter(
+            (self.COST_PENALTIES.get(c.action.cost, 0.0) for c in candidates),
+            float, n)
+        if violations:
+            total = resolution * 10.0 + objective - cost
+        else:
+            total = objective - cost
+
+        for i, candidate in enumerate(candidates):
+            candidate.constraint_resolution_score = float(resolution[i])
+            candidate.objective_score = float(objective[i])
+            candidate.cost_penalty = float(cost[i])
+            candidate.score = float(total[i])
+
     def select_best_action(self, threshold: float = 0.0) -> Optional[ActionCandidate]:
         """Select the best action based on current state.
 
@@ -316,25 +616,52 @@ class Scorer:
         Returns:
             Best action candidate, or None if no action should be taken
         """
-        # Use ALL violations (critical + warning) for scoring
-        violations = self.get_all_violations()
+        # Use ALL violations (critical + warning) for scoring; one
+        # constraint evaluation serves every candidate.
+        violations = self.check_constraints()[1]
         candidates = self.generate_candidates()
+        pool = candidates
 
-        # Score all candidates
-        for candidate in candidates:
-            self.score_candidate(candidate, violations)
+        if violations:
+            # Prune candidates whose action touches no violated metric;
+            # they cannot have a positive resolution score.
+            batch_index = self._batch_index
+            v_idx = np.fromiter(
+                (batch_index[v.constraint.metric] for v in violations),
+                np.int64, len(violations))
+            touches = self._action_metric_mask[:, v_idx].any(axis=1)
+            action_index = self._action_index
+            useful = [c for c in candidates
+                      if touches[action_index[id(c.action)]]]
+            if useful:
+                pool = useful
+
+        # Score the pool in one fused vectorized pass
+        self._score_batch(pool, violations)
 
         # Filter by violations if any exist
         if violations:
             # Only consider actions that help resolve violations
-            resolving = [c for c in candidates if c.constraint_resolution_score > 0]
+            resolving = [c for c in pool if c.constraint_resolution_score > 0]
             if resolving:
-                candidates = resolving
-
-        # Sort by score
-        candidates.sort(key=lambda c: c.score, reverse=True)
-
-        if candidates and candidates[0].score > threshold:
-            return candidates[0]
+                pool = resolving
+            elif pool is not candidates:
+                # Nothing in the pruned pool actually helps: fall back
+                # to the full set so the ranking matches unpruned
+                # selection.
+                self._score_batch(candidates, violations)
+                pool = candidates
+
+        if not pool:
+            return None
+
+        # Single max pass; ties resolve to the earliest candidate, the
+        # same winner a stable descending sort would put first.
+        best = max(pool, key=lambda c: c.score)
+        if best.score > threshold:
+            # Effects dicts are only materialized for the winner, for
+            # execution and explain output.
+            self.predict_effects(best)
+            return best
 
         return None
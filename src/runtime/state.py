@@ -4,24 +4,61 @@ NovaIR State Manager - Manages system state and history.
 This module tracks current state values and maintains history for analysis.
 """
 
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from collections import deque
 
+import numpy as np
 
-@dataclass
+# Ring capacity matches the snapshot history depth.
+_RING_CAPACITY = 100
+
+# Centered x-axis and its squared norm per window length, shared by all
+# trend computations (the x side of the regression never changes).
+_TREND_X: Dict[int, Tuple[np.ndarray, float]] = {}
+
+
+# Normalization factors for metrics without metadata (bounds 0..100)
+_DEFAULT_NORM = (0.0, 0.01)
+
+
+def _centered_x(n: int) -> Tuple[np.ndarray, float]:
+    cached = _TREND_X.get(n)
+    if cached is None:
+        x = np.arange(n, dtype=np.float32) - (n - 1) / 2.0
+        cached = _TREND_X[n] = (x, float(np.dot(x, x)))
+    return cached
+
+
+@dataclass(slots=True)
 class StateSnapshot:
-    """A snapshot of all state values at a point in time."""
-    timestamp: datetime
-    values: Dict[str, float]
+    """A snapshot of all state values at a point in time.
+
+    `values` is a dense array copy, one slot per metric in first-seen
+    order; `index` maps names to slots and is shared with the owning
+    StateManager. Metrics registered after this snapshot was taken map
+    past the end of `values` and read as absent.
+    """
+    timestamp_ns: int
+    values: np.ndarray
+    index: Dict[str, int]
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock capture time, converted lazily from the raw ns."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
     def get(self, name: str, default: float = 0.0) -> float:
         """Get a state value by name."""
-        return self.values.get(name, default)
+        i = self.index.get(name)
+        if i is None or i >= len(self.values):
+            return default
+        return float(self.values[i])
 
 
-@dataclass
+@dataclass(slots=True)
 class StateManager:
     """Manages current state and history."""
 
@@ -34,13 +71,82 @@ class StateManager:
     # State metadata (units, bounds, etc.)
     metadata: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
+    # Bumped on every write so consumers can cache derived results
+    # (e.g. constraint evaluations) keyed on the version.
+    version: int = 0
+
+    # Per-metric float32 ring buffers mirroring the snapshot history,
+    # so jitter/trend run on contiguous arrays instead of walking
+    # snapshot dicts.
+    _rings: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+    _ring_head: Dict[str, int] = field(default_factory=dict, repr=False)
+    _ring_count: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    # Dense mirror of `current` (which stays the public dict API since
+    # metric names arrive dynamically from readers): one slot per
+    # metric in first-seen order, so snapshots are an array copy.
+    _name_to_idx: Dict[str, int] = field(default_factory=dict, repr=False)
+    _values: np.ndarray = field(default_factory=lambda: np.zeros(0), repr=False)
+
+    # Per-metric (min, 1/(max-min)) pairs maintained by set_metadata;
+    # None marks degenerate bounds. normalize() reads these instead of
+    # re-deriving the range from metadata dicts on every call.
+    _norm: Dict[str, Optional[Tuple[float, float]]] = field(
+        default_factory=dict, repr=False)
+
+    def _register(self, name: str) -> int:
+        """Assign the next dense slot to a new metric, growing the array."""
+        idx = self._name_to_idx[name] = len(self._name_to_idx)
+        if idx >= len(self._values):
+            grown = np.zeros(max(8, 2 * len(self._values)))
+            grown[:len(self._values)] = self._values
+            self._values = grown
+        return idx
+
+    def register_metric(self, name: str) -> int:
+        """Return the dense slot for a metric, assigning one if new.
+
+        Slots are stable for the manager's lifetime, so consumers (e.g.
+        the scorer) can resolve names once and read by integer id.
+        """
+        idx = self._name_to_idx.get(name)
+        if idx is None:
+            idx = self._register(name)
+        return idx
+
+    def get_by_idx(self, idx: int, default: float = 0.0) -> float:
+        """Get a current value by dense slot (see register_metric)."""
+        if 0 <= idx < len(self._name_to_idx):
+            return float(self._values[idx])
+        return default
+
+    def dense_values(self) -> np.ndarray:
+        """Live dense value array, indexed by register_metric slots.
+
+        Replaced (not mutated) when the slot table grows; fetch it per
+        use rather than holding a reference across registrations.
+        """
+        return self._values
+
     def update(self, name: str, value: float) -> None:
         """Update a single state value."""
         self.current[name] = value
+        idx = self._name_to_idx.get(name)
+        if idx is None:
+            idx = self._register(name)
+        self._values[idx] = value
+        self.version += 1
 
     def update_all(self, values: Dict[str, float]) -> None:
         """Update multiple state values at once."""
         self.current.update(values)
+        name_to_idx = self._name_to_idx
+        for name, value in values.items():
+            idx = name_to_idx.get(name)
+            if idx is None:
+                idx = self._register(name)
+            self._values[idx] = value
+        self.version += 1
 
     def get(self, name: str, default: float = 0.0) -> float:
         """Get current value of a state."""
@@ -49,29 +155,64 @@ class StateManager:
     def snapshot(self) -> StateSnapshot:
         """Take a snapshot of current state and add to history."""
         snap = StateSnapshot(
-            timestamp=datetime.now(),
-            values=dict(self.current)
+            timestamp_ns=time.time_ns(),
+            values=self._values[:len(self._name_to_idx)].copy(),
+            index=self._name_to_idx,
         )
         self.history.append(snap)
+
+        rings = self._rings
+        heads = self._ring_head
+        counts = self._ring_count
+        for name, value in self.current.items():
+            ring = rings.get(name)
+            if ring is None:
+                ring = rings[name] = np.empty(_RING_CAPACITY, dtype=np.float32)
+                heads[name] = 0
+                counts[name] = 0
+            head = heads[name]
+            ring[head] = value
+            heads[name] = (head + 1) % _RING_CAPACITY
+            if counts[name] < _RING_CAPACITY:
+                counts[name] += 1
+
         return snap
 
     def get_history(self, name: str, count: int = 10) -> List[float]:
         """Get recent history of a state value."""
+        idx = self._name_to_idx.get(name)
+        if idx is None:
+            return []
         values = []
         for snap in list(self.history)[-count:]:
-            if name in snap.values:
-                values.append(snap.values[name])
+            if idx < len(snap.values):
+                values.append(float(snap.values[idx]))
         return values
 
+    def _ring_window(self, name: str, window: int) -> Optional[np.ndarray]:
+        """Return the most recent `window` samples of a metric's ring.
+
+        Returns a view when the window is contiguous, a small copy when
+        it wraps, and None when fewer than two samples exist.
+        """
+        ring = self._rings.get(name)
+        if ring is None:
+            return None
+        k = min(window, self._ring_count[name])
+        if k < 2:
+            return None
+        head = self._ring_head[name]
+        start = head - k
+        if start >= 0:
+            return ring[start:head]
+        return np.concatenate((ring[start:], ring[:head]))
+
     def calculate_jitter(self, name: str, window: int = 10) -> float:
-        """Calculate jitter (variance) of a state over recent history."""
-        values = self.get_history(name, window)
-        if len(values) < 2:
+        """Calculate jitter (standard deviation) of a state over recent history."""
+        values = self._ring_window(name, window)
+        if values is None:
             return 0.0
-
-        mean = sum(values) / len(values)
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        return variance ** 0.5  # Standard deviation
+        return float(np.std(values))
 
     def calculate_trend(self, name: str, window: int = 10) -> float:
         """Calculate trend (slope) of a state over recent history.
@@ -79,22 +220,14 @@ class StateManager:
         Returns:
             Positive = increasing, Negative = decreasing, ~0 = stable
         """
-        values = self.get_history(name, window)
-        if len(values) < 2:
-            return 0.0
-
-        # Simple linear regression slope
-        n = len(values)
-        x_mean = (n - 1) / 2
-        y_mean = sum(values) / n
-
-        numerator = sum((i - x_mean) * (v - y_mean) for i, v in enumerate(values))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
-
-        if denominator == 0:
+        values = self._ring_window(name, window)
+        if values is None:
             return 0.0
 
-        return numerator / denominator
+        # Linear regression slope with the y-mean term dropped: x is
+        # centered, so dot(x, y - mean) == dot(x, y).
+        x, denominator = _centered_x(len(values))
+        return float(np.dot(x, values) / denominator)
 
     def set_metadata(self, name: str, **kwargs) -> None:
         """Set metadata for a state (unit, min, max, etc.)."""
@@ -102,6 +235,12 @@ class StateManager:
             self.metadata[name] = {}
         self.metadata[name].update(kwargs)
 
+        meta = self.metadata[name]
+        min_val = meta.get("min", 0)
+        max_val = meta.get("max", 100)
+        self._norm[name] = (None if max_val == min_val
+                            else (min_val, 1.0 / (max_val - min_val)))
+
     def get_metadata(self, name: str) -> Dict[str, Any]:
         """Get metadata for a state."""
         return self.metadata.get(name, {})
@@ -114,15 +253,12 @@ class StateManager:
         if value is None:
             value = self.get(name)
 
-        meta = self.get_metadata(name)
-        min_val = meta.get("min", 0)
-        max_val = meta.get("max", 100)
-
-        if max_val == min_val:
+        norm = self._norm.get(name, _DEFAULT_NORM)
+        if norm is None:
             return 0.5
 
-        normalized = (value - min_val) / (max_val - min_val)
-        return max(0.0, min(1.0, normalized))
+        min_val, inv_range = norm
+        return max(0.0, min(1.0, (value - min_val) * inv_range))
 
     def __repr__(self) -> str:
         states = ", ".join(f"{k}={v:.1f}" for k, v in self.current.items())